@@ -0,0 +1,285 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from app.config.settings import STORAGE_BASE_PATH
+
+logger = logging.getLogger(__name__)
+
+_TTL_SECONDS = 30 * 24 * 3600  # entries older than 30 days are ignored
+_MAX_ROWS = 10_000
+
+# Second-tier semantic cache: near-duplicate inputs reuse prior responses.
+_EMBEDDING_MODEL = "text-embedding-3-small"
+_SEMANTIC_SIM_THRESHOLD = 0.92
+_SEMANTIC_MAX_ROWS = 500  # brute-force cosine scan; keep the table small
+
+_lock = threading.Lock()
+_conn: sqlite3.Connection | None = None
+
+# Bound concurrent OpenAI calls so message bursts don't trip rate limits
+# or blow out tail latency; cache hits never touch the semaphore
+_LLM_CONCURRENCY = asyncio.Semaphore(4)
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        STORAGE_BASE_PATH.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            STORAGE_BASE_PATH / "llm_cache.db", check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, "
+            "content TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS semantic_entries ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "scope TEXT NOT NULL, "
+            "embedding TEXT NOT NULL, "
+            "content TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        conn.commit()
+        _conn = conn
+    return _conn
+
+
+def _cache_key(
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    response_format: dict | None,
+) -> str:
+    payload = json.dumps(
+        [model, messages, temperature, max_tokens, response_format],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> str | None:
+    try:
+        with _lock:
+            row = (
+                _get_conn()
+                .execute(
+                    "SELECT content, created_at FROM completions WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+    except sqlite3.Error:
+        logger.warning("LLM cache read failed; calling API directly.")
+        return None
+
+    if row is None or time.time() - row[1] > _TTL_SECONDS:
+        return None
+    return row[0]
+
+
+def _cache_put(key: str, content: str) -> None:
+    try:
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO completions (key, content, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, content, time.time()),
+            )
+            # Keep the newest _MAX_ROWS entries
+            conn.execute(
+                "DELETE FROM completions WHERE key IN ("
+                "SELECT key FROM completions "
+                "ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (_MAX_ROWS,),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        logger.warning("LLM cache write failed; response not cached.")
+
+
+def _embed(client, text: str) -> list[float] | None:
+    try:
+        response = client.embeddings.create(model=_EMBEDDING_MODEL, input=text)
+        return list(response.data[0].embedding)
+    except Exception:
+        logger.warning("Embedding call failed; semantic cache skipped.")
+        return None
+
+
+async def _embed_async(client, text: str) -> list[float] | None:
+    try:
+        response = await client.embeddings.create(model=_EMBEDDING_MODEL, input=text)
+        return list(response.data[0].embedding)
+    except Exception:
+        logger.warning("Embedding call failed; semantic cache skipped.")
+        return None
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = num_a = num_b = 0.0
+    for x, y in zip(a, b):
+        dot += x * y
+        num_a += x * x
+        num_b += y * y
+    if num_a == 0.0 or num_b == 0.0:
+        return 0.0
+    return dot / ((num_a**0.5) * (num_b**0.5))
+
+
+def _semantic_get(scope: str, embedding: list[float]) -> str | None:
+    try:
+        with _lock:
+            rows = (
+                _get_conn()
+                .execute(
+                    "SELECT embedding, content, created_at FROM semantic_entries "
+                    "WHERE scope = ?",
+                    (scope,),
+                )
+                .fetchall()
+            )
+    except sqlite3.Error:
+        logger.warning("Semantic cache read failed.")
+        return None
+
+    now = time.time()
+    best_content: str | None = None
+    best_similarity = _SEMANTIC_SIM_THRESHOLD
+    for stored_embedding, content, created_at in rows:
+        if now - created_at > _TTL_SECONDS:
+            continue
+        similarity = _cosine(embedding, json.loads(stored_embedding))
+        if similarity > best_similarity:
+            best_similarity = similarity
+            best_content = content
+    return best_content
+
+
+def _semantic_put(scope: str, embedding: list[float], content: str) -> None:
+    try:
+        with _lock:
+            conn = _get_conn()
+            conn.execute(
+                "INSERT INTO semantic_entries (scope, embedding, content, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (scope, json.dumps(embedding), content, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM semantic_entries WHERE id IN ("
+                "SELECT id FROM semantic_entries "
+                "ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (_SEMANTIC_MAX_ROWS,),
+            )
+            conn.commit()
+    except sqlite3.Error:
+        logger.warning("Semantic cache write failed.")
+
+
+def cached_completion(
+    client,
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    semantic_scope: str | None = None,
+    semantic_text: str | None = None,
+    response_format: dict | None = None,
+) -> str:
+    """Return the completion text, serving repeats from a local SQLite cache.
+
+    Identical (model, messages, temperature, max_tokens) requests hit the
+    exact cache instead of paying network latency and token cost again.
+    When semantic_scope/semantic_text are given, near-duplicate inputs
+    (cosine similarity above the threshold, within the same scope) also
+    reuse a prior response before falling through to the API.
+    """
+    key = _cache_key(model, messages, temperature, max_tokens, response_format)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    embedding: list[float] | None = None
+    if semantic_scope is not None and semantic_text:
+        embedding = _embed(client, semantic_text)
+        if embedding is not None:
+            near_match = _semantic_get(semantic_scope, embedding)
+            if near_match is not None:
+                _cache_put(key, near_match)
+                return near_match
+
+    extra = {"response_format": response_format} if response_format else {}
+    response = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        **extra,
+    )
+    content = response.choices[0].message.content or ""
+    if isinstance(content, str) and content:
+        _cache_put(key, content)
+        if embedding is not None and semantic_scope is not None:
+            _semantic_put(semantic_scope, embedding, content)
+    return content
+
+
+async def cached_completion_async(
+    client,
+    model: str,
+    messages: list[dict],
+    temperature: float,
+    max_tokens: int,
+    semantic_scope: str | None = None,
+    semantic_text: str | None = None,
+    response_format: dict | None = None,
+) -> str:
+    """Async counterpart of cached_completion for AsyncOpenAI clients.
+
+    The cache lookups run via to_thread: the semantic probe in particular
+    decodes and scans up to 500 stored embeddings under the lock shared
+    with sync callers, which must not block the event loop.
+    """
+    key = _cache_key(model, messages, temperature, max_tokens, response_format)
+    cached = await asyncio.to_thread(_cache_get, key)
+    if cached is not None:
+        return cached
+
+    embedding: list[float] | None = None
+    if semantic_scope is not None and semantic_text:
+        async with _LLM_CONCURRENCY:
+            embedding = await _embed_async(client, semantic_text)
+        if embedding is not None:
+            near_match = await asyncio.to_thread(
+                _semantic_get, semantic_scope, embedding
+            )
+            if near_match is not None:
+                await asyncio.to_thread(_cache_put, key, near_match)
+                return near_match
+
+    extra = {"response_format": response_format} if response_format else {}
+    async with _LLM_CONCURRENCY:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **extra,
+        )
+    content = response.choices[0].message.content or ""
+    if isinstance(content, str) and content:
+        await asyncio.to_thread(_cache_put, key, content)
+        if embedding is not None and semantic_scope is not None:
+            await asyncio.to_thread(_semantic_put, semantic_scope, embedding, content)
+    return content
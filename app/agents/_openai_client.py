@@ -0,0 +1,33 @@
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+from app.config.settings import OPENAI_API_KEY, PROXY_URL
+
+# One connection pool shared by every agent module instead of three —
+# fewer sockets, and keep-alive reuse concentrates on a single pool.
+_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_client: OpenAI | None = None
+_async_client: AsyncOpenAI | None = None
+
+
+def get_client() -> OpenAI:
+    """Return the lazily created process-wide sync OpenAI client."""
+    global _client
+    if _client is None:
+        _client = OpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=httpx.Client(proxy=PROXY_URL, http2=True, limits=_LIMITS),
+        )
+    return _client
+
+
+def get_async_client() -> AsyncOpenAI:
+    """Return the lazily created process-wide async OpenAI client."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(proxy=PROXY_URL, http2=True, limits=_LIMITS),
+        )
+    return _async_client
@@ -2,15 +2,19 @@ import json
 import logging
 import re
 
-import httpx
-from openai import OpenAI
-
-from app.config.settings import OPENAI_API_KEY, PROXY_URL
+from app.agents._json_utils import parse_llm_json
+from app.agents._llm_cache import cached_completion, cached_completion_async
+from app.agents._openai_client import get_async_client, get_client
 
 logger = logging.getLogger(__name__)
 
-_http_client = httpx.Client(proxy=PROXY_URL) if PROXY_URL else None
-_client = OpenAI(api_key=OPENAI_API_KEY, http_client=_http_client)
+# Shared process-wide clients (one connection pool across all agents)
+_client = get_client()
+_async_client = get_async_client()
+
+# Precompiled sanitization patterns — these run on every ingest
+_NON_SUBFOLDER_RE = re.compile(r"[^a-z0-9-]")
+_NON_FILENAME_RE = re.compile(r"[^a-z0-9.\-]")
 
 RESTRUCTURE_PROMPT = (
     "You are a content restructuring assistant for a GitHub-based knowledge archive.\n"
@@ -29,6 +33,35 @@ RESTRUCTURE_PROMPT = (
 )
 
 
+def _build_user_message(
+    text: str,
+    content_type: str,
+    original_name: str,
+    tags: list[str],
+    summary: str,
+    topic: str,
+) -> str:
+    return (
+        f"Content type: {content_type}\n"
+        f"Original name: {original_name}\n"
+        f"Tags: {', '.join(tags)}\n"
+        f"Summary: {summary}\n"
+        f"Topic: {topic}\n\n"
+        f"Content:\n{text}"
+    )
+
+
+def _parse_restructure(
+    raw: str,
+    content_type: str,
+    original_name: str,
+    tags: list[str],
+    summary: str,
+) -> dict:
+    result = parse_llm_json(raw)
+    return _validate_result(result, content_type, original_name, tags, summary)
+
+
 def restructure_for_github(
     text: str,
     content_type: str,
@@ -45,37 +78,71 @@ def restructure_for_github(
     if not text or not text.strip():
         return _fallback_result(content_type, original_name, tags, summary, topic)
 
-    truncated = text[:3000]
-    user_message = (
-        f"Content type: {content_type}\n"
-        f"Original name: {original_name}\n"
-        f"Tags: {', '.join(tags)}\n"
-        f"Summary: {summary}\n"
-        f"Topic: {topic}\n\n"
-        f"Content:\n{truncated}"
-    )
+    truncated = text[:2000]
 
     try:
-        response = _client.chat.completions.create(
+        raw = cached_completion(
+            _client,
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": RESTRUCTURE_PROMPT},
-                {"role": "user", "content": user_message},
+                {
+                    "role": "user",
+                    "content": _build_user_message(
+                        truncated, content_type, original_name, tags, summary, topic
+                    ),
+                },
             ],
-            temperature=0.3,
-            max_tokens=1500,
+            temperature=0,
+            max_tokens=1200,
+            response_format={"type": "json_object"},
+            semantic_scope="restructure_for_github",
+            semantic_text=truncated,
         )
+        return _parse_restructure(raw, content_type, original_name, tags, summary)
+
+    except json.JSONDecodeError:
+        logger.warning("OpenAI returned non-JSON for restructuring.")
+        return _fallback_result(content_type, original_name, tags, summary, topic)
+    except Exception:
+        logger.exception("OpenAI restructuring call failed.")
+        return _fallback_result(content_type, original_name, tags, summary, topic)
 
-        raw = response.choices[0].message.content or ""
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[-1]
-        if raw.endswith("```"):
-            raw = raw.rsplit("```", 1)[0]
-        raw = raw.strip()
 
-        result = json.loads(raw)
-        return _validate_result(result, content_type, original_name, tags, summary)
+async def restructure_for_github_async(
+    text: str,
+    content_type: str,
+    original_name: str,
+    tags: list[str],
+    summary: str,
+    topic: str,
+) -> dict:
+    """Async variant of restructure_for_github for the bot's event loop."""
+    if not text or not text.strip():
+        return _fallback_result(content_type, original_name, tags, summary, topic)
+
+    truncated = text[:2000]
+
+    try:
+        raw = await cached_completion_async(
+            _async_client,
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": RESTRUCTURE_PROMPT},
+                {
+                    "role": "user",
+                    "content": _build_user_message(
+                        truncated, content_type, original_name, tags, summary, topic
+                    ),
+                },
+            ],
+            temperature=0,
+            max_tokens=1200,
+            response_format={"type": "json_object"},
+            semantic_scope="restructure_for_github",
+            semantic_text=truncated,
+        )
+        return _parse_restructure(raw, content_type, original_name, tags, summary)
 
     except json.JSONDecodeError:
         logger.warning("OpenAI returned non-JSON for restructuring.")
@@ -100,13 +167,13 @@ def _validate_result(
     subfolder = result.get("suggested_subfolder", "general")
     if not isinstance(subfolder, str) or not subfolder.strip():
         subfolder = "general"
-    subfolder = re.sub(r"[^a-z0-9-]", "-", subfolder.lower().strip())[:50]
+    subfolder = _NON_SUBFOLDER_RE.sub("-", subfolder.lower().strip())[:50]
 
     filename = result.get("suggested_filename", "")
     if not isinstance(filename, str) or not filename.strip():
-        safe_name = re.sub(r"[^a-z0-9-]", "-", original_name.lower())[:40]
+        safe_name = _NON_SUBFOLDER_RE.sub("-", original_name.lower())[:40]
         filename = f"{safe_name}.md"
-    filename = re.sub(r"[^a-z0-9.\-]", "-", filename.lower().strip())[:60]
+    filename = _NON_FILENAME_RE.sub("-", filename.lower().strip())[:60]
     if not filename.endswith(".md"):
         filename = filename.rsplit(".", 1)[0] + ".md"
 
@@ -131,7 +198,7 @@ def _fallback_result(
     topic: str,
 ) -> dict:
     """Deterministic fallback when AI is unavailable."""
-    safe_name = re.sub(r"[^a-z0-9-]", "-", original_name.lower())[:40]
+    safe_name = _NON_SUBFOLDER_RE.sub("-", original_name.lower())[:40]
     return {
         "markdown": _build_default_markdown(original_name, tags, summary),
         "suggested_subfolder": topic or "general",
@@ -1,15 +1,15 @@
 import json
 import logging
 
-import httpx
-from openai import OpenAI
-
-from app.config.settings import OPENAI_API_KEY, PROXY_URL
+from app.agents._json_utils import parse_llm_json
+from app.agents._llm_cache import cached_completion, cached_completion_async
+from app.agents._openai_client import get_async_client, get_client
 
 logger = logging.getLogger(__name__)
 
-_http_client = httpx.Client(proxy=PROXY_URL) if PROXY_URL else None
-_client = OpenAI(api_key=OPENAI_API_KEY, http_client=_http_client)
+# Shared process-wide clients (one connection pool across all agents)
+_client = get_client()
+_async_client = get_async_client()
 
 DECISION_PROMPT = (
     "You are a decision support assistant for a knowledge management system.\n"
@@ -24,19 +24,13 @@ DECISION_PROMPT = (
 )
 
 
-def make_publish_decision(
+def _build_context(
     content_type: str,
     has_trigger: bool,
     tags: list[str],
     summary: str,
     topic: str,
-) -> dict:
-    """Use AI to generate a decision recommendation about publishing to GitHub.
-
-    Returns dict with keys: recommendation, rationale, confidence.
-    AI generates the text, but the application controls persistence.
-    """
-    # Build context for the decision
+) -> str:
     options = [
         "publish_to_github: Restructure content and push to GitHub repository",
         "store_locally_only: Keep content in local storage without publishing",
@@ -52,28 +46,73 @@ def make_publish_decision(
     )
     for option in options:
         context_text += f"- {option}\n"
+    return context_text
+
+
+def _parse_decision(raw: str, has_trigger: bool) -> dict:
+    result = parse_llm_json(raw)
+    return _validate_decision(result, has_trigger)
+
+
+def make_publish_decision(
+    content_type: str,
+    has_trigger: bool,
+    tags: list[str],
+    summary: str,
+    topic: str,
+) -> dict:
+    """Use AI to generate a decision recommendation about publishing to GitHub.
+
+    Returns dict with keys: recommendation, rationale, confidence.
+    AI generates the text, but the application controls persistence.
+    """
+    context_text = _build_context(content_type, has_trigger, tags, summary, topic)
 
     try:
-        response = _client.chat.completions.create(
+        raw = cached_completion(
+            _client,
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": DECISION_PROMPT},
                 {"role": "user", "content": context_text},
             ],
-            temperature=0.3,
-            max_tokens=500,
+            temperature=0,
+            max_tokens=250,
+            response_format={"type": "json_object"},
         )
+        return _parse_decision(raw, has_trigger)
 
-        raw = response.choices[0].message.content or ""
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[-1]
-        if raw.endswith("```"):
-            raw = raw.rsplit("```", 1)[0]
-        raw = raw.strip()
+    except json.JSONDecodeError:
+        logger.warning("OpenAI returned non-JSON for decision making.")
+        return _fallback_decision(has_trigger)
+    except Exception:
+        logger.exception("OpenAI decision call failed.")
+        return _fallback_decision(has_trigger)
+
+
+async def make_publish_decision_async(
+    content_type: str,
+    has_trigger: bool,
+    tags: list[str],
+    summary: str,
+    topic: str,
+) -> dict:
+    """Async variant of make_publish_decision for the bot's event loop."""
+    context_text = _build_context(content_type, has_trigger, tags, summary, topic)
 
-        result = json.loads(raw)
-        return _validate_decision(result, has_trigger)
+    try:
+        raw = await cached_completion_async(
+            _async_client,
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": DECISION_PROMPT},
+                {"role": "user", "content": context_text},
+            ],
+            temperature=0,
+            max_tokens=250,
+            response_format={"type": "json_object"},
+        )
+        return _parse_decision(raw, has_trigger)
 
     except json.JSONDecodeError:
         logger.warning("OpenAI returned non-JSON for decision making.")
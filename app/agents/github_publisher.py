@@ -1,8 +1,10 @@
 import base64
+import functools
 import logging
 from pathlib import PurePosixPath
 
-from github import Auth, Github, GithubException
+import urllib3
+from github import Auth, Github, GithubException, InputGitTreeElement
 
 from app.config.settings import (
     GITHUB_CONTENT_TYPES,
@@ -13,17 +15,52 @@ from app.config.settings import (
 logger = logging.getLogger(__name__)
 
 _auth = Auth.Token(GITHUB_TOKEN)
-_github = Github(auth=_auth)
+# Larger pages cut pagination round-trips on get_contents; the pooled
+# session keeps connections alive across calls and retries transient
+# GitHub 5xx responses instead of surfacing them to the handlers.
+_github = Github(
+    auth=_auth,
+    per_page=100,
+    pool_size=20,
+    retry=urllib3.util.retry.Retry(
+        total=5, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+    ),
+)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_repo():
     return _github.get_repo(GITHUB_DEFAULT_REPO)
 
 
+# Folders confirmed to exist in the repo; lets hot paths skip the
+# get_contents round-trip entirely after the first probe.
+_known_folders: set[str] = set()
+
+# Multiple of 3 bytes so chunk encodings concatenate without padding
+_B64_CHUNK_SIZE = 57 * 1024
+
+
+def _b64encode_chunked(data: bytes) -> str:
+    """Base64-encode in chunks off a memoryview.
+
+    Avoids holding the full-size intermediate bytes object alongside the
+    decoded string — the transient overhead stays at chunk granularity,
+    which matters for multi-megabyte uploads.
+    """
+    view = memoryview(data)
+    return "".join(
+        base64.b64encode(view[i : i + _B64_CHUNK_SIZE]).decode("ascii")
+        for i in range(0, len(data), _B64_CHUNK_SIZE)
+    )
+
+
 def ensure_repo_folders() -> None:
     """Create top-level content-type folders in the repo if they don't exist."""
     repo = _get_repo()
     for folder in GITHUB_CONTENT_TYPES:
+        if folder in _known_folders:
+            continue
         try:
             repo.get_contents(folder)
         except GithubException as exc:
@@ -36,6 +73,38 @@ def ensure_repo_folders() -> None:
                 logger.info("Created GitHub folder: %s/", folder)
             else:
                 raise
+        _known_folders.add(folder)
+
+
+def publish_files(files: list[tuple[str, bytes]], commit_message: str) -> str:
+    """Publish several files in a single commit via the Git Data API.
+
+    One tree + one commit replaces a REST round-trip per file plus a
+    get_contents probe per ancestor folder; git tracks the directories
+    implicitly through the blob paths. Returns the URL of the first file.
+    """
+    if not files:
+        raise ValueError("publish_files requires at least one file")
+
+    repo = _get_repo()
+    branch_name = repo.default_branch
+    branch = repo.get_branch(branch_name)
+    base_commit = repo.get_git_commit(branch.commit.sha)
+
+    elements = []
+    for path, data in files:
+        blob = repo.create_git_blob(_b64encode_chunked(data), "base64")
+        elements.append(
+            InputGitTreeElement(path=path, mode="100644", type="blob", sha=blob.sha)
+        )
+
+    base_tree = repo.get_git_tree(base_commit.tree.sha)
+    tree = repo.create_git_tree(elements, base_tree)
+    commit = repo.create_git_commit(commit_message, tree, [base_commit])
+    repo.get_git_ref(f"heads/{branch_name}").edit(commit.sha)
+    logger.info("Published %d file(s) in one commit: %s", len(files), commit.sha)
+
+    return f"{repo.html_url}/blob/{branch_name}/{files[0][0]}"
 
 
 def publish_text_content(
@@ -81,7 +150,7 @@ def publish_binary_content(
     """Publish binary content (images, PDFs, etc.) to GitHub. Returns the file URL."""
     repo = _get_repo()
     file_path = str(PurePosixPath(folder_path) / filename)
-    encoded = base64.b64encode(data).decode("ascii")
+    encoded = _b64encode_chunked(data)
 
     try:
         existing = repo.get_contents(file_path)
@@ -112,6 +181,8 @@ def _ensure_parent_folders(repo, folder_path: str) -> None:
     parts = PurePosixPath(folder_path).parts
     for i in range(1, len(parts) + 1):
         partial = "/".join(parts[:i])
+        if partial in _known_folders:
+            continue
         try:
             repo.get_contents(partial)
         except GithubException as exc:
@@ -124,6 +195,7 @@ def _ensure_parent_folders(repo, folder_path: str) -> None:
                 logger.info("Created GitHub folder: %s/", partial)
             else:
                 raise
+        _known_folders.add(partial)
 
 
 # Map local content types to GitHub repo folder names
@@ -1,15 +1,15 @@
 import json
 import logging
 
-import httpx
-from openai import OpenAI
-
-from app.config.settings import OPENAI_API_KEY, PROXY_URL
+from app.agents._json_utils import parse_llm_json
+from app.agents._llm_cache import cached_completion, cached_completion_async
+from app.agents._openai_client import get_async_client, get_client
 
 logger = logging.getLogger(__name__)
 
-_http_client = httpx.Client(proxy=PROXY_URL) if PROXY_URL else None
-_client = OpenAI(api_key=OPENAI_API_KEY, http_client=_http_client)
+# Shared process-wide clients (one connection pool across all agents)
+_client = get_client()
+_async_client = get_async_client()
 
 SYSTEM_PROMPT = (
     "You are a content classification assistant. "
@@ -23,72 +23,106 @@ SYSTEM_PROMPT = (
 )
 
 
+def _empty_analysis(content_type: str) -> dict:
+    return {
+        "tags": [content_type],
+        "summary": "No text content available for analysis.",
+        "topic": "general",
+    }
+
+
+def _failed_analysis(content_type: str) -> dict:
+    return {
+        "tags": [content_type],
+        "summary": "AI analysis failed — content stored without summary.",
+        "topic": "general",
+    }
+
+
+def _build_messages(text: str, content_type: str) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"Content type: {content_type}\n\nText:\n{text}",
+        },
+    ]
+
+
+def _parse_analysis(raw: str, content_type: str) -> dict:
+    result = parse_llm_json(raw)
+
+    # Validate structure
+    tags = result.get("tags", [content_type])
+    if not isinstance(tags, list):
+        tags = [content_type]
+
+    summary = result.get("summary", "")
+    if not isinstance(summary, str) or not summary:
+        summary = "No summary generated."
+
+    topic = result.get("topic", "general")
+    if not isinstance(topic, str) or not topic:
+        topic = "general"
+
+    return {
+        "tags": [str(t).lower().strip() for t in tags[:5]],
+        "summary": summary[:500],
+        "topic": topic.lower().strip(),
+    }
+
+
 def analyze_content(text: str, content_type: str) -> dict:
     if not text or not text.strip():
-        return {
-            "tags": [content_type],
-            "summary": "No text content available for analysis.",
-            "topic": "general",
-        }
+        return _empty_analysis(content_type)
 
     # Truncate very long text to stay within token limits
     truncated = text[:3000]
 
     try:
-        response = _client.chat.completions.create(
+        raw = cached_completion(
+            _client,
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": f"Content type: {content_type}\n\nText:\n{truncated}",
-                },
-            ],
-            temperature=0.3,
-            max_tokens=300,
+            messages=_build_messages(truncated, content_type),
+            temperature=0,
+            max_tokens=200,
+            response_format={"type": "json_object"},
+            semantic_scope="analyze_content",
+            semantic_text=truncated,
         )
+        return _parse_analysis(raw, content_type)
 
-        raw = response.choices[0].message.content or ""
-        # Strip potential markdown fences
-        raw = raw.strip()
-        if raw.startswith("```"):
-            raw = raw.split("\n", 1)[-1]
-        if raw.endswith("```"):
-            raw = raw.rsplit("```", 1)[0]
-        raw = raw.strip()
-
-        result = json.loads(raw)
+    except json.JSONDecodeError:
+        logger.warning("OpenAI returned non-JSON response.")
+        return _failed_analysis(content_type)
+    except Exception:
+        logger.exception("OpenAI API call failed.")
+        return _failed_analysis(content_type)
 
-        # Validate structure
-        tags = result.get("tags", [content_type])
-        if not isinstance(tags, list):
-            tags = [content_type]
 
-        summary = result.get("summary", "")
-        if not isinstance(summary, str) or not summary:
-            summary = "No summary generated."
+async def analyze_content_async(text: str, content_type: str) -> dict:
+    """Async variant of analyze_content for use on the bot's event loop."""
+    if not text or not text.strip():
+        return _empty_analysis(content_type)
 
-        topic = result.get("topic", "general")
-        if not isinstance(topic, str) or not topic:
-            topic = "general"
+    truncated = text[:3000]
 
-        return {
-            "tags": [str(t).lower().strip() for t in tags[:5]],
-            "summary": summary[:500],
-            "topic": topic.lower().strip(),
-        }
+    try:
+        raw = await cached_completion_async(
+            _async_client,
+            model="gpt-4o-mini",
+            messages=_build_messages(truncated, content_type),
+            temperature=0,
+            max_tokens=200,
+            response_format={"type": "json_object"},
+            semantic_scope="analyze_content",
+            semantic_text=truncated,
+        )
+        return _parse_analysis(raw, content_type)
 
     except json.JSONDecodeError:
         logger.warning("OpenAI returned non-JSON response.")
-        return {
-            "tags": [content_type],
-            "summary": "AI analysis failed — content stored without summary.",
-            "topic": "general",
-        }
+        return _failed_analysis(content_type)
     except Exception:
         logger.exception("OpenAI API call failed.")
-        return {
-            "tags": [content_type],
-            "summary": "AI analysis failed — content stored without summary.",
-            "topic": "general",
-        }
+        return _failed_analysis(content_type)
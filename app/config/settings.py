@@ -4,24 +4,31 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-# Load .env from project root
+# Load .env from project root — skip the parse entirely when absent
+# (deployed environments that inject real env vars). .env values remain
+# authoritative over ambient process variables, as before.
 _project_root = Path(__file__).resolve().parent.parent.parent
-load_dotenv(_project_root / ".env", override=True)
-
-REQUIRED_ENV_VARS = [
-    "TELEGRAM_BOT_TOKEN",
-    "TELEGRAM_ALLOWED_USER_ID",
-    "OPENAI_API_KEY",
-    "STORAGE_BASE_PATH",
-    "DATABASE_URL",
-    "ENVIRONMENT",
-    "GITHUB_TOKEN",
-    "GITHUB_DEFAULT_REPO",
-]
+_env_file = _project_root / ".env"
+if _env_file.is_file():
+    load_dotenv(_env_file, override=True)
+
+REQUIRED_ENV_VARS = frozenset(
+    {
+        "TELEGRAM_BOT_TOKEN",
+        "TELEGRAM_ALLOWED_USER_ID",
+        "OPENAI_API_KEY",
+        "STORAGE_BASE_PATH",
+        "DATABASE_URL",
+        "ENVIRONMENT",
+        "GITHUB_TOKEN",
+        "GITHUB_DEFAULT_REPO",
+    }
+)
 
 
 def _validate_env() -> None:
-    missing = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+    # os.environ.get is a plain dict lookup; empty values count as missing
+    missing = sorted(var for var in REQUIRED_ENV_VARS if not os.environ.get(var))
     if missing:
         print(
             f"FATAL: Missing required environment variables: {', '.join(missing)}",
@@ -1,6 +1,17 @@
 import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -10,20 +21,35 @@ class Base(DeclarativeBase):
 
 class ContentItem(Base):
     __tablename__ = "content_items"
+    __table_args__ = (
+        Index(
+            "ix_content_user_type_created",
+            "telegram_user_id",
+            "content_type",
+            "created_at",
+        ),
+        Index("ix_content_topic_published", "topic", "github_published"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     content_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     file_path: Mapped[str] = mapped_column(Text, nullable=False)
-    original_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    telegram_message_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    telegram_user_id: Mapped[int] = mapped_column(Integer, nullable=False)
-    tags: Mapped[str | None] = mapped_column(Text, nullable=True)
+    original_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    # BigInteger: Telegram message and user ids can exceed 2^31
+    telegram_message_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    telegram_user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # JSON list of tag strings — queryable DB-side, no join/split on read
+    tags: Mapped[list[str] | None] = mapped_column(JSON, nullable=True)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     topic: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     github_published: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False, server_default="0"
     )
     github_url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Memoized AI restructure output — identical input produces identical
+    # output, so publish retries reuse it instead of re-calling the LLM
+    restructured_markdown: Mapped[str | None] = mapped_column(Text, nullable=True)
+    suggested_path: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, nullable=False, server_default=func.now()
     )
@@ -36,8 +62,28 @@ class ContentItem(Base):
         )
 
 
+# list_by_content_type filters by type and orders by recency; serve the
+# ORDER BY straight from the index instead of sort-after-scan
+Index(
+    "ix_ci_type_created",
+    ContentItem.content_type,
+    ContentItem.created_at.desc(),
+)
+# get_latest_unpublished touches only the (usually small) unpublished slice
+Index(
+    "ix_ci_unpublished",
+    ContentItem.created_at.desc(),
+    sqlite_where=text("github_published = 0"),
+)
+# filter_by_date range-scans on recency alone
+Index("ix_ci_created", ContentItem.created_at.desc())
+
+
 class Decision(Base):
     __tablename__ = "decisions"
+    __table_args__ = (
+        Index("ix_decision_item_created", "content_item_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     decision_name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -49,7 +95,7 @@ class Decision(Base):
     content_item_id: Mapped[int | None] = mapped_column(
         Integer, nullable=True, index=True
     )
-    telegram_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    telegram_message_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
         DateTime, nullable=False, server_default=func.now()
     )
@@ -1,31 +1,318 @@
+import asyncio
 import datetime
+import functools
 import logging
-from collections.abc import Sequence
+import re
+import threading
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
 
-from sqlalchemy import create_engine, select
+from cachetools import TTLCache
+from sqlalchemy import (
+    Row,
+    Text,
+    bindparam,
+    cast,
+    create_engine,
+    event,
+    insert,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.config.settings import DATABASE_URL
 from app.database.models import Base, ContentItem, Decision
 
 logger = logging.getLogger(__name__)
 
-# For SQLite, strip the sqlite:/// prefix for the engine path
-_engine_url = DATABASE_URL
-if DATABASE_URL.startswith("sqlite:///") and not DATABASE_URL.startswith("sqlite:////"):
-    # Relative path — resolve from project root
+# Anchor a relative SQLite path next to the storage directory
+_engine_url = make_url(DATABASE_URL)
+if (
+    _engine_url.drivername.startswith("sqlite")
+    and _engine_url.database
+    and not _engine_url.database.startswith("/")
+):
     from app.config.settings import STORAGE_BASE_PATH
 
-    db_file = DATABASE_URL.replace("sqlite:///", "")
     STORAGE_BASE_PATH.mkdir(parents=True, exist_ok=True)
-    _engine_url = f"sqlite:///{STORAGE_BASE_PATH.parent / db_file}"
+    _engine_url = _engine_url.set(
+        database=str(STORAGE_BASE_PATH.parent / _engine_url.database)
+    )
 
-engine = create_engine(_engine_url, echo=False)
-SessionLocal = sessionmaker(bind=engine)
+# Warm connection pool: tiny queries stop paying per-call connection
+# setup. check_same_thread is off because sessions run on whichever
+# worker thread asyncio.to_thread picks.
+engine = create_engine(
+    _engine_url,
+    echo=False,
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    connect_args={"check_same_thread": False},
+    query_cache_size=1200,
+)
+
+# Pre-create the database file so the first real query doesn't pay the
+# cold sqlite3_open/file-creation path while a user waits
+if (
+    engine.dialect.name == "sqlite"
+    and _engine_url.database
+    and _engine_url.database != ":memory:"
+):
+    _db_path = Path(_engine_url.database)
+    _db_path.parent.mkdir(parents=True, exist_ok=True)
+    _db_path.touch(exist_ok=True)
+
+SessionLocal = sessionmaker(expire_on_commit=False, autoflush=False)
+
+# WAL lets readers proceed during writes; the remaining pragmas trade
+# crash-paranoia defaults for page-cache- and mmap-backed reads.
+_SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+    "foreign_keys=ON",
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        cursor = dbapi_conn.cursor()
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+
+# Read results repeat far more often than data changes (e.g. /list spam
+# or a /publish retry moments after a save); serve repeats from memory
+# and accept up to 60 s of staleness. Writers bump a version counter
+# baked into every cache key, so invalidation is O(1) and stale entries
+# simply age out of the TTL/LRU bounds.
+_READ_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_read_cache_lock = threading.Lock()
+_read_cache_version = 0
+
+
+def _cached_read(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, _read_cache_version, args, tuple(sorted(kwargs.items())))
+        with _read_cache_lock:
+            if key in _READ_CACHE:
+                return _READ_CACHE[key]
+        result = fn(*args, **kwargs)
+        with _read_cache_lock:
+            _READ_CACHE[key] = result
+        return result
+
+    return wrapper
+
+
+def _invalidate_read_cache() -> None:
+    global _read_cache_version
+    with _read_cache_lock:
+        _read_cache_version += 1
+
+
+@contextmanager
+def _session() -> Iterator[Session]:
+    # Bound to the module engine at call time so tests can swap it in
+    session = SessionLocal(bind=engine)
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _execute_streamed(session: Session, stmt, params: dict | None = None) -> list[Row]:
+    # yield_per streams the cursor in 500-row partitions instead of
+    # buffering the entire result server-side before the first row
+    result = session.execute(stmt, params or {}, execution_options={"yield_per": 500})
+    return list(result)
+
+
+# Columns the Telegram handlers actually render (plus file_path for the
+# publish flow). Fetching these as plain Rows skips full ORM hydration
+# and identity-map bookkeeping on every list call.
+_CONTENT_SUMMARY_COLS = (
+    ContentItem.id,
+    ContentItem.content_type,
+    ContentItem.file_path,
+    ContentItem.original_name,
+    ContentItem.created_at,
+    ContentItem.github_published,
+    ContentItem.tags,
+    ContentItem.summary,
+    ContentItem.topic,
+    ContentItem.restructured_markdown,
+    ContentItem.suggested_path,
+)
+
+# Prepared statements for the hot read helpers — built once instead of
+# reconstructing the select() object on every call
+_STMT_LIST_BY_TYPE = (
+    select(*_CONTENT_SUMMARY_COLS)
+    .where(ContentItem.content_type == bindparam("content_type"))
+    .order_by(ContentItem.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_STMT_SEARCH = (
+    select(*_CONTENT_SUMMARY_COLS)
+    .where(
+        (ContentItem.original_name.ilike(bindparam("pattern")))
+        | (cast(ContentItem.tags, Text).ilike(bindparam("pattern")))
+        | (ContentItem.summary.ilike(bindparam("pattern")))
+        | (ContentItem.topic.ilike(bindparam("pattern")))
+    )
+    .order_by(ContentItem.created_at.desc())
+    .limit(bindparam("limit"))
+)
+# Prefix-only search over the two indexed short columns — a B-tree range
+# scan, unlike the leading-% substring scan below
+_STMT_PREFIX_SEARCH = (
+    select(*_CONTENT_SUMMARY_COLS)
+    .where(
+        (ContentItem.original_name.like(bindparam("prefix")))
+        | (ContentItem.topic.like(bindparam("prefix")))
+    )
+    .order_by(ContentItem.created_at.desc())
+    .limit(bindparam("limit"))
+)
+# Half-open interval [start, end): a clean index range scan without the
+# time.max microsecond boundary trick
+_STMT_FILTER_DATE = (
+    select(*_CONTENT_SUMMARY_COLS)
+    .where(
+        ContentItem.created_at >= bindparam("start_dt"),
+        ContentItem.created_at < bindparam("end_dt"),
+    )
+    .order_by(ContentItem.created_at.desc())
+    .limit(bindparam("limit"))
+)
+_STMT_LATEST_UNPUBLISHED = (
+    select(*_CONTENT_SUMMARY_COLS)
+    .where(ContentItem.github_published == False)  # noqa: E712
+    .order_by(ContentItem.created_at.desc())
+    .limit(20)
+)
+# Decision listings skip the fat context/options text blobs; readers
+# only surface the name, outcome and rationale
+_DECISION_SUMMARY_COLS = (
+    Decision.id,
+    Decision.decision_name,
+    Decision.recommendation,
+    Decision.rationale,
+    Decision.confidence,
+    Decision.content_item_id,
+    Decision.telegram_message_id,
+    Decision.created_at,
+)
+
+_STMT_DECISIONS_BY_ITEM = (
+    select(*_DECISION_SUMMARY_COLS)
+    .where(Decision.content_item_id == bindparam("content_item_id"))
+    .order_by(Decision.created_at.desc())
+)
+_STMT_RECENT_DECISIONS = (
+    select(*_DECISION_SUMMARY_COLS)
+    .order_by(Decision.created_at.desc())
+    .limit(bindparam("limit"))
+)
+
+
+# Full-text search over content metadata. FTS5 is SQLite-only, so it
+# lives behind a dialect check; search falls back to the LIKE scan when
+# the index is unavailable (e.g. after a PostgreSQL swap).
+_FTS_DDL = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5(
+        original_name, tags, summary, topic,
+        content='content_items', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS content_fts_ai AFTER INSERT ON content_items
+    BEGIN
+        INSERT INTO content_fts(rowid, original_name, tags, summary, topic)
+        VALUES (new.id, new.original_name, new.tags, new.summary, new.topic);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS content_fts_ad AFTER DELETE ON content_items
+    BEGIN
+        INSERT INTO content_fts(content_fts, rowid, original_name, tags, summary, topic)
+        VALUES ('delete', old.id, old.original_name, old.tags, old.summary, old.topic);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS content_fts_au AFTER UPDATE ON content_items
+    BEGIN
+        INSERT INTO content_fts(content_fts, rowid, original_name, tags, summary, topic)
+        VALUES ('delete', old.id, old.original_name, old.tags, old.summary, old.topic);
+        INSERT INTO content_fts(rowid, original_name, tags, summary, topic)
+        VALUES (new.id, new.original_name, new.tags, new.summary, new.topic);
+    END
+    """,
+)
+
+_FTS_SEARCH_SQL = text(
+    "SELECT ci.id, ci.content_type, ci.file_path, ci.original_name, "
+    "ci.created_at, ci.github_published, ci.tags, ci.summary, ci.topic, "
+    "ci.restructured_markdown, ci.suggested_path "
+    "FROM content_items ci "
+    "JOIN content_fts f ON f.rowid = ci.id "
+    "WHERE content_fts MATCH :query "
+    "ORDER BY bm25(content_fts) LIMIT :limit"
+).columns(*_CONTENT_SUMMARY_COLS)
+
+_FTS_TOKEN_RE = re.compile(r"\w+")
+
+
+def _init_search_index() -> None:
+    with engine.begin() as conn:
+        fts_existed = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'content_fts'"
+        ).fetchone()
+        for ddl in _FTS_DDL:
+            conn.exec_driver_sql(ddl)
+        if not fts_existed:
+            # Populate a brand-new index from rows that predate it; the
+            # triggers keep it current from here on, so startups never
+            # pay a full re-tokenize again
+            conn.exec_driver_sql(
+                "INSERT INTO content_fts(content_fts) VALUES ('rebuild')"
+            )
+
+
+def _fts_query(keyword: str) -> str:
+    # Quote tokens so FTS operators in user input stay literal; drop
+    # fragments too short to be meaningful search terms
+    tokens = [t for t in _FTS_TOKEN_RE.findall(keyword) if len(t) >= 3]
+    return " ".join(f'"{token}"' for token in tokens)
 
 
 def init_db() -> None:
     Base.metadata.create_all(engine)
+    if engine.dialect.name == "sqlite":
+        _init_search_index()
+        with engine.begin() as conn:
+            # Refresh planner statistics so the new indexes get picked,
+            # and parse the schema now so the first user-facing query
+            # starts against a warm connection
+            conn.exec_driver_sql("ANALYZE")
+            conn.exec_driver_sql("PRAGMA schema_version")
     logger.info("Database schema initialized.")
 
 
@@ -35,11 +322,11 @@ def save_content_item(
     original_name: str,
     telegram_message_id: int,
     telegram_user_id: int,
-    tags: str | None = None,
+    tags: list[str] | None = None,
     summary: str | None = None,
     topic: str | None = None,
 ) -> ContentItem:
-    with Session(engine) as session:
+    with _session() as session:
         item = ContentItem(
             content_type=content_type,
             file_path=file_path,
@@ -51,78 +338,146 @@ def save_content_item(
             topic=topic,
         )
         session.add(item)
+        # expire_on_commit=False keeps attributes live and the PK is
+        # populated at flush, so no refresh SELECT is needed
         session.commit()
-        session.refresh(item)
         logger.info("Saved content item id=%s type=%s", item.id, content_type)
+        _invalidate_read_cache()
         return item
 
 
+def save_item_with_decision(
+    item_fields: dict, decision_fields: dict
+) -> tuple[ContentItem, Decision]:
+    """Insert a content item and its publish decision in one transaction.
+
+    Halves the per-message fsync count versus separate save_content_item
+    and save_decision commits; the decision is linked to the new item id
+    assigned at flush.
+    """
+    with _session() as session:
+        item = ContentItem(**item_fields)
+        session.add(item)
+        session.flush()
+        decision = Decision(content_item_id=item.id, **decision_fields)
+        session.add(decision)
+        session.commit()
+        logger.info(
+            "Saved content item id=%s with decision id=%s (%s)",
+            item.id,
+            decision.id,
+            decision.recommendation,
+        )
+        _invalidate_read_cache()
+        return item, decision
+
+
+def save_content_items(rows: list[dict]) -> list[int]:
+    """Insert several content items in one transaction.
+
+    One executemany + one fsync instead of a commit per row — the bulk
+    path for multi-item ingests such as Telegram album uploads. Each row
+    dict takes the same keys as save_content_item. Returns the new ids.
+    """
+    if not rows:
+        return []
+    with _session() as session:
+        result = session.execute(insert(ContentItem).returning(ContentItem.id), rows)
+        ids = [row[0] for row in result]
+        session.commit()
+        logger.info("Saved %d content items in one transaction.", len(ids))
+        _invalidate_read_cache()
+        return ids
+
+
 def update_content_ai_fields(
     item_id: int,
-    tags: str | None = None,
+    tags: list[str] | None = None,
     summary: str | None = None,
     topic: str | None = None,
 ) -> None:
-    with Session(engine) as session:
-        item = session.get(ContentItem, item_id)
-        if item is None:
-            logger.warning("Content item %s not found for AI update.", item_id)
+    provided = {
+        column.key: value
+        for column, value in (
+            (ContentItem.tags, tags),
+            (ContentItem.summary, summary),
+            (ContentItem.topic, topic),
+        )
+        if value is not None
+    }
+    if not provided:
+        return
+    with _session() as session:
+        # Single UPDATE instead of SELECT-then-UPDATE; the WHERE guard
+        # lets the DB skip the write (and its WAL page) when every
+        # provided value already matches the stored one
+        changed_guard = or_(
+            *(
+                getattr(ContentItem, key).is_distinct_from(value)
+                for key, value in provided.items()
+            )
+        )
+        result = session.execute(
+            update(ContentItem)
+            .where(ContentItem.id == item_id, changed_guard)
+            .values(**provided)
+        )
+        if result.rowcount == 0:
+            # Missing row or values already up to date — nothing to commit
             return
-        if tags is not None:
-            item.tags = tags
-        if summary is not None:
-            item.summary = summary
-        if topic is not None:
-            item.topic = topic
         session.commit()
         logger.info("Updated AI fields for content item id=%s", item_id)
+        _invalidate_read_cache()
 
 
-def list_by_content_type(content_type: str) -> Sequence[ContentItem]:
-    with Session(engine) as session:
-        stmt = (
-            select(ContentItem)
-            .where(ContentItem.content_type == content_type)
-            .order_by(ContentItem.created_at.desc())
+@_cached_read
+def list_by_content_type(content_type: str, limit: int = 20) -> Sequence[Row]:
+    with _session() as session:
+        return _execute_streamed(
+            session, _STMT_LIST_BY_TYPE, {"content_type": content_type, "limit": limit}
         )
-        return list(session.scalars(stmt).all())
-
-
-def search_by_keyword(keyword: str) -> Sequence[ContentItem]:
-    with Session(engine) as session:
-        pattern = f"%{keyword}%"
-        stmt = (
-            select(ContentItem)
-            .where(
-                (ContentItem.original_name.ilike(pattern))
-                | (ContentItem.tags.ilike(pattern))
-                | (ContentItem.summary.ilike(pattern))
-                | (ContentItem.topic.ilike(pattern))
+
+
+def search_by_keyword(keyword: str, limit: int = 20) -> Sequence[Row]:
+    query = _fts_query(keyword) if engine.dialect.name == "sqlite" else ""
+    with _session() as session:
+        if query:
+            return _execute_streamed(
+                session, _FTS_SEARCH_SQL, {"query": query, "limit": limit}
+            )
+        # Fallback: non-SQLite engines, or keywords with no indexable token.
+        # A wildcard-free keyword gets an index-friendly prefix pass over
+        # name/topic first, before paying for the full substring scan.
+        if keyword and not any(c in keyword for c in "%*_"):
+            rows = _execute_streamed(
+                session, _STMT_PREFIX_SEARCH, {"prefix": f"{keyword}%", "limit": limit}
             )
-            .order_by(ContentItem.created_at.desc())
+            if rows:
+                return rows
+        return _execute_streamed(
+            session, _STMT_SEARCH, {"pattern": f"%{keyword}%", "limit": limit}
         )
-        return list(session.scalars(stmt).all())
 
 
 def filter_by_date(
-    start: datetime.date, end: datetime.date | None = None
-) -> Sequence[ContentItem]:
-    with Session(engine) as session:
-        start_dt = datetime.datetime.combine(start, datetime.time.min)
-        end_dt = datetime.datetime.combine(end or start, datetime.time.max)
-        stmt = (
-            select(ContentItem)
-            .where(ContentItem.created_at.between(start_dt, end_dt))
-            .order_by(ContentItem.created_at.desc())
-        )
-        return list(session.scalars(stmt).all())
+    start: datetime.date, end: datetime.date | None = None, limit: int = 20
+) -> Sequence[Row]:
+    with _session() as session:
+        params = {
+            "start_dt": datetime.datetime.combine(start, datetime.time.min),
+            "end_dt": datetime.datetime.combine(
+                (end or start) + datetime.timedelta(days=1), datetime.time.min
+            ),
+            "limit": limit,
+        }
+        return _execute_streamed(session, _STMT_FILTER_DATE, params)
 
 
 def update_github_status(
     item_id: int,
     github_url: str,
 ) -> None:
-    with Session(engine) as session:
+    with _session() as session:
         item = session.get(ContentItem, item_id)
         if item is None:
             logger.warning("Content item %s not found for GitHub update.", item_id)
@@ -131,25 +486,35 @@ def update_github_status(
         item.github_url = github_url
         session.commit()
         logger.info("Updated GitHub status for content item id=%s", item_id)
+        _invalidate_read_cache()
+
+
+def update_restructure_cache(item_id: int, markdown: str, suggested_path: str) -> None:
+    """Memoize the AI restructure output for an item (publish retries
+    reuse it instead of repeating the LLM call)."""
+    with _session() as session:
+        session.execute(
+            update(ContentItem)
+            .where(ContentItem.id == item_id)
+            .values(restructured_markdown=markdown, suggested_path=suggested_path)
+        )
+        session.commit()
+        _invalidate_read_cache()
 
 
+@_cached_read
 def get_content_item_by_id(item_id: int) -> ContentItem | None:
-    with Session(engine) as session:
-        item = session.get(ContentItem, item_id)
-        if item:
-            session.expunge(item)
-        return item
+    with _session() as session:
+        # expire_on_commit=False keeps attributes loaded after the session
+        # closes, so no expunge dance is needed; repeated lookups of the
+        # same id are served by the TTL read cache above
+        return session.get(ContentItem, item_id)
 
 
-def get_latest_unpublished() -> Sequence[ContentItem]:
-    with Session(engine) as session:
-        stmt = (
-            select(ContentItem)
-            .where(ContentItem.github_published == False)  # noqa: E712
-            .order_by(ContentItem.created_at.desc())
-            .limit(20)
-        )
-        return list(session.scalars(stmt).all())
+@_cached_read
+def get_latest_unpublished() -> Sequence[Row]:
+    with _session() as session:
+        return session.execute(_STMT_LATEST_UNPUBLISHED).all()
 
 
 def save_decision(
@@ -163,7 +528,7 @@ def save_decision(
     telegram_message_id: int | None = None,
 ) -> Decision:
     """Save a Decision Object to the database."""
-    with Session(engine) as session:
+    with _session() as session:
         decision = Decision(
             decision_name=decision_name,
             context=context,
@@ -176,29 +541,63 @@ def save_decision(
         )
         session.add(decision)
         session.commit()
-        session.refresh(decision)
         logger.info(
             "Saved decision id=%s name=%s recommendation=%s",
             decision.id,
             decision_name,
             recommendation,
         )
+        _invalidate_read_cache()
         return decision
 
 
-def get_decisions_by_content_item(content_item_id: int) -> Sequence[Decision]:
+def get_decisions_by_content_item(content_item_id: int) -> Sequence[Row]:
     """Get all decisions related to a specific content item."""
-    with Session(engine) as session:
-        stmt = (
-            select(Decision)
-            .where(Decision.content_item_id == content_item_id)
-            .order_by(Decision.created_at.desc())
-        )
-        return list(session.scalars(stmt).all())
+    with _session() as session:
+        return session.execute(
+            _STMT_DECISIONS_BY_ITEM, {"content_item_id": content_item_id}
+        ).all()
 
 
-def get_recent_decisions(limit: int = 20) -> Sequence[Decision]:
+@_cached_read
+def get_recent_decisions(limit: int = 20) -> Sequence[Row]:
     """Get the most recent decisions."""
-    with Session(engine) as session:
-        stmt = select(Decision).order_by(Decision.created_at.desc()).limit(limit)
-        return list(session.scalars(stmt).all())
+    with _session() as session:
+        return session.execute(_STMT_RECENT_DECISIONS, {"limit": limit}).all()
+
+
+# ── Async facade ────────────────────────────────────────────────────────────
+# The Telegram handlers run on an event loop; these wrappers guarantee every
+# repository call executes on a worker thread. A sqlite+aiosqlite engine was
+# considered and rejected: aiosqlite itself just proxies to a background
+# thread, so this is the same architecture without forking the sync API the
+# tests and init path depend on.
+
+
+def _as_async(fn):
+    # run_in_executor instead of asyncio.to_thread: skips the per-call
+    # contextvars copy_context()/ctx.run wrapper, which this app never
+    # needs — repository calls carry no context variables
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        if kwargs:
+            return await loop.run_in_executor(
+                None, functools.partial(fn, *args, **kwargs)
+            )
+        return await loop.run_in_executor(None, fn, *args)
+
+    return wrapper
+
+
+save_content_item_async = _as_async(save_content_item)
+save_item_with_decision_async = _as_async(save_item_with_decision)
+save_decision_async = _as_async(save_decision)
+update_content_ai_fields_async = _as_async(update_content_ai_fields)
+update_github_status_async = _as_async(update_github_status)
+update_restructure_cache_async = _as_async(update_restructure_cache)
+get_content_item_by_id_async = _as_async(get_content_item_by_id)
+list_by_content_type_async = _as_async(list_by_content_type)
+search_by_keyword_async = _as_async(search_by_keyword)
+filter_by_date_async = _as_async(filter_by_date)
+get_latest_unpublished_async = _as_async(get_latest_unpublished)
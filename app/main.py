@@ -1,13 +1,35 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
-def main() -> None:
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        stream=sys.stdout,
+def _setup_logging() -> None:
+    """Route log records through a queue drained off the request path.
+
+    Handlers and repository calls log on every message; a QueueHandler
+    makes those calls a lock-free enqueue, with a background listener
+    doing the actual stdout writes.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def main() -> None:
+    _setup_logging()
     logger = logging.getLogger(__name__)
 
     # Config is validated on import — will sys.exit(1) if env vars are missing
@@ -15,20 +37,20 @@ def main() -> None:
 
     logger.info("Starting Brain Box (%s)...", ENVIRONMENT)
 
-    # Initialize storage directories
-    from app.storage.file_storage import init_storage
-
-    init_storage()
-
-    # Initialize database schema
     from app.database.repository import init_db
-
-    init_db()
-
-    # Create and run the Telegram bot
+    from app.storage.file_storage import init_storage
     from app.telegram.bot import create_bot_application
 
-    bot_app = create_bot_application()
+    # Storage mkdirs, schema creation and the bot build are independent;
+    # overlap them so startup costs max() instead of sum()
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        storage_future = executor.submit(init_storage)
+        db_future = executor.submit(init_db)
+        bot_future = executor.submit(create_bot_application)
+        storage_future.result()
+        db_future.result()
+        bot_app = bot_future.result()
+
     logger.info("Brain Box is running. Press Ctrl+C to stop.")
     bot_app.run_polling(drop_pending_updates=True)
 
@@ -0,0 +1,88 @@
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+
+from app.config.settings import CONTENT_TYPES, STORAGE_BASE_PATH
+
+logger = logging.getLogger(__name__)
+
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+
+def init_storage() -> None:
+    """Create the storage base directory and content-type folders if missing."""
+    STORAGE_BASE_PATH.mkdir(parents=True, exist_ok=True)
+    for content_type in CONTENT_TYPES:
+        (STORAGE_BASE_PATH / content_type).mkdir(exist_ok=True)
+    logger.info("Storage initialized at %s", STORAGE_BASE_PATH)
+
+
+def _sanitize_filename(name: str) -> str:
+    """Replace filesystem-unsafe characters and guard against empty names."""
+    sanitized = _INVALID_FILENAME_CHARS.sub("_", name).strip()
+    if not sanitized.strip("._ "):
+        return "unnamed"
+    return sanitized[:200]
+
+
+def _build_filename(telegram_message_id: int, original_name: str) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{timestamp}_{telegram_message_id}_{_sanitize_filename(original_name)}"
+
+
+def _resolve_target(
+    content_type: str,
+    topic: str,
+    telegram_message_id: int,
+    original_name: str,
+) -> Path:
+    if content_type not in CONTENT_TYPES:
+        raise ValueError(f"Unknown content type: {content_type}")
+
+    # Hybrid structure: content type first, topic inside
+    folder = STORAGE_BASE_PATH / content_type / _sanitize_filename(topic)
+    folder.mkdir(parents=True, exist_ok=True)
+    return folder / _build_filename(telegram_message_id, original_name)
+
+
+def reserve_file_path(
+    content_type: str,
+    topic: str,
+    telegram_message_id: int,
+    original_name: str,
+) -> Path:
+    """Create the target folder and return the path a download can stream to.
+
+    Lets callers write large payloads directly to their final location
+    instead of buffering them in memory first.
+    """
+    return _resolve_target(content_type, topic, telegram_message_id, original_name)
+
+
+def save_file(
+    content_type: str,
+    topic: str,
+    telegram_message_id: int,
+    original_name: str,
+    data: bytes,
+) -> Path:
+    """Save raw bytes to local storage. Returns the path of the written file."""
+    path = _resolve_target(content_type, topic, telegram_message_id, original_name)
+    path.write_bytes(data)
+    logger.info("Saved file: %s", path)
+    return path
+
+
+def save_text_content(
+    content_type: str,
+    topic: str,
+    telegram_message_id: int,
+    original_name: str,
+    text: str,
+) -> Path:
+    """Save text content to local storage. Returns the path of the written file."""
+    path = _resolve_target(content_type, topic, telegram_message_id, original_name)
+    path.write_text(text, encoding="utf-8")
+    logger.info("Saved text content: %s", path)
+    return path
@@ -8,22 +8,35 @@ from telegram.ext import (
 )
 
 from app.config.settings import PROXY_URL, TELEGRAM_BOT_TOKEN
-from app.telegram.handlers import (
-    date_handler,
-    document_handler,
-    help_handler,
-    list_handler,
-    photo_handler,
-    publish_handler,
-    search_handler,
-    start_handler,
-    text_handler,
-)
 
 logger = logging.getLogger(__name__)
 
+# Combined filters built once instead of per registration; the TEXT
+# check is the common case and runs before the COMMAND exclusion
+DOCUMENT_FILTER = filters.Document.ALL
+PHOTO_FILTER = filters.PHOTO
+TEXT_NONCOMMAND_FILTER = filters.TEXT & ~filters.COMMAND
+
 
 def create_bot_application():
+    # Imported here, not at module scope: handlers transitively pull in
+    # the OpenAI/GitHub clients, which would otherwise load before the
+    # bot even starts building
+    from app.telegram.handlers import (
+        date_handler,
+        document_handler,
+        help_handler,
+        list_handler,
+        photo_handler,
+        publish_handler,
+        search_handler,
+        start_handler,
+        text_handler,
+    )
+
+    # A larger keep-alive pool plus HTTP/2 lets file downloads and API
+    # calls multiplex over warm connections instead of paying a TLS
+    # handshake per get_file/download
     builder = (
         ApplicationBuilder()
         .token(TELEGRAM_BOT_TOKEN)
@@ -31,6 +44,9 @@ def create_bot_application():
         .read_timeout(30.0)
         .write_timeout(30.0)
         .pool_timeout(10.0)
+        .connection_pool_size(20)
+        .http_version("2")
+        .get_updates_http_version("2")
     )
 
     if PROXY_URL:
@@ -48,9 +64,9 @@ def create_bot_application():
     app.add_handler(CommandHandler("publish", publish_handler))
 
     # Content handlers
-    app.add_handler(MessageHandler(filters.Document.ALL, document_handler))
-    app.add_handler(MessageHandler(filters.PHOTO, photo_handler))
-    app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, text_handler))
+    app.add_handler(MessageHandler(DOCUMENT_FILTER, document_handler))
+    app.add_handler(MessageHandler(PHOTO_FILTER, photo_handler))
+    app.add_handler(MessageHandler(TEXT_NONCOMMAND_FILTER, text_handler))
 
     logger.info("Telegram bot handlers registered.")
     return app
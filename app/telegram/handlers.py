@@ -1,74 +1,127 @@
 import asyncio
+import atexit
+import functools
 import logging
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
-from app.agents.aggregation import detect_content_type, extract_text
-from app.agents.content_restructurer import restructure_for_github
-from app.agents.decision_maker import make_publish_decision
+from app.agents.aggregation import (
+    detect_content_type,
+    extract_text,
+    extract_texts_from_urls,
+)
+from app.agents.content_restructurer import restructure_for_github_async
+from app.agents.decision_maker import make_publish_decision_async
 from app.agents.github_publisher import (
     CONTENT_TYPE_TO_GITHUB_FOLDER,
     ensure_repo_folders,
-    publish_binary_content,
-    publish_text_content,
+    publish_files,
 )
-from app.agents.organization import analyze_content
-from app.config.settings import TELEGRAM_ALLOWED_USER_ID
+from app.agents.organization import analyze_content_async
+from app.config.settings import CONTENT_TYPES, TELEGRAM_ALLOWED_USER_ID
 from app.database import repository as db
-from app.storage.file_storage import save_file, save_text_content
+from app.storage.file_storage import reserve_file_path, save_text_content
 
 logger = logging.getLogger(__name__)
 
-URL_PATTERN = re.compile(r"https?://[^\s]+")
+VALID_CONTENT_TYPES: frozenset[str] = frozenset(CONTENT_TYPES)
+# Types whose original file is republished alongside the markdown
+_BINARY_CONTENT_TYPES: frozenset[str] = frozenset({"images", "documents"})
+
 GITHUB_TRIGGER_PATTERN = re.compile(r"#github\b", re.IGNORECASE)
+# One pass for both detections on the text path — notes can be multi-KB.
+# Case-insensitivity is scoped to the trigger branch so URL matching
+# stays byte-identical to the original case-sensitive pattern.
+COMBINED_PATTERN = re.compile(r"(?P<url>https?://\S+)|(?P<gh>(?i:#github\b))")
+
+# Long-lived pools instead of the loop's default executor: threads stay
+# warm across messages, and blocking disk/GitHub work can't starve the
+# CPU-bound extraction (or vice versa)
+_IO_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="bb-io")
+_CPU_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="bb-cpu"
+)
+atexit.register(_IO_POOL.shutdown)
+atexit.register(_CPU_POOL.shutdown)
+
+
+def _run_in_pool(pool: ThreadPoolExecutor, fn, *args, **kwargs):
+    # Unlike asyncio.to_thread, run_in_executor skips the per-call
+    # contextvars copy — this bot sets no context variables
+    loop = asyncio.get_running_loop()
+    if kwargs:
+        return loop.run_in_executor(pool, functools.partial(fn, *args, **kwargs))
+    return loop.run_in_executor(pool, fn, *args)
+
+
+def _run_io(fn, *args, **kwargs):
+    return _run_in_pool(_IO_POOL, fn, *args, **kwargs)
+
+
+def _run_cpu(fn, *args, **kwargs):
+    return _run_in_pool(_CPU_POOL, fn, *args, **kwargs)
+
+
+# Frozen allow-list: C-level hash lookup per check, and extensible to
+# several users without touching the call sites. The id is already
+# coerced to int at settings import.
+_ALLOWED_USER_IDS: frozenset[int] = frozenset({TELEGRAM_ALLOWED_USER_ID})
 
 
 def _is_authorized(user_id: int) -> bool:
-    return user_id == TELEGRAM_ALLOWED_USER_ID
+    return user_id in _ALLOWED_USER_IDS
 
 
-async def _reject_unauthorized(update: Update) -> None:
-    if update.effective_message:
-        await update.effective_message.reply_text(
-            "Access denied. You are not authorized to use this bot."
-        )
+def authorized(fn):
+    """Run the auth/message guard once and hand the handler a validated
+    (message, user_id) pair instead of repeating the boilerplate."""
+
+    @functools.wraps(fn)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        user = update.effective_user
+        message = update.effective_message
+        if not user or not _is_authorized(user.id):
+            if message:
+                await message.reply_text(
+                    "Access denied. You are not authorized to use this bot."
+                )
+            return
+        if message is None:
+            return
+        await fn(update, context, message, user.id)
+
+    return wrapper
+
+
+def _extract_stored_text(content_type: str, file_path: Path) -> str:
+    """Read a stored file and extract its text (runs on the CPU pool)."""
+    return extract_text(content_type, file_path.read_bytes())
 
 
 def _has_publish_trigger(text: str | None) -> bool:
     """Check if the message text contains a #github publish trigger."""
-    if not text:
-        return False
-    return bool(GITHUB_TRIGGER_PATTERN.search(text))
+    return bool(text and GITHUB_TRIGGER_PATTERN.search(text))
 
 
-async def _make_and_persist_decision(
+def _decision_fields(
+    decision: dict,
     content_type: str,
     has_trigger: bool,
     ai_result: dict,
-    item_id: int,
+    tags_str: str,
     telegram_message_id: int,
 ) -> dict:
-    """Generate a publish decision using AI and persist it to the database.
+    """Build the Decision column values for an AI-generated publish decision.
 
     AI generates recommendation, rationale, and confidence.
     Application controls persistence.
-    Returns the decision dict.
     """
-    # AI generates decision recommendation
-    decision = await asyncio.to_thread(
-        make_publish_decision,
-        content_type=content_type,
-        has_trigger=has_trigger,
-        tags=ai_result["tags"],
-        summary=ai_result["summary"],
-        topic=ai_result["topic"],
-    )
-
-    # Application persists decision to database
     options_text = (
         "1. publish_to_github: Restructure content and push to GitHub\n"
         "2. store_locally_only: Keep in local storage only"
@@ -76,24 +129,36 @@ async def _make_and_persist_decision(
     context_text = (
         f"Content type: {content_type}\n"
         f"Has trigger: {has_trigger}\n"
-        f"Tags: {', '.join(ai_result['tags'])}\n"
+        f"Tags: {tags_str}\n"
         f"Summary: {ai_result['summary']}\n"
         f"Topic: {ai_result['topic']}"
     )
 
-    await asyncio.to_thread(
-        db.save_decision,
-        decision_name="github_publish_decision",
-        context=context_text,
-        options=options_text,
-        recommendation=decision["recommendation"],
-        rationale=decision["rationale"],
-        confidence=decision["confidence"],
-        content_item_id=item_id,
-        telegram_message_id=telegram_message_id,
-    )
+    return {
+        "decision_name": "github_publish_decision",
+        "context": context_text,
+        "options": options_text,
+        "recommendation": decision["recommendation"],
+        "rationale": decision["rationale"],
+        "confidence": decision["confidence"],
+        "telegram_message_id": telegram_message_id,
+    }
+
+
+# The repo's top-level folder set is static; pay the GitHub round-trips
+# once per process instead of on every publish
+_folders_ensured = False
+_folders_lock = asyncio.Lock()
 
-    return decision
+
+async def _ensure_repo_folders_once() -> None:
+    global _folders_ensured
+    if _folders_ensured:
+        return
+    async with _folders_lock:
+        if not _folders_ensured:
+            await _run_io(ensure_repo_folders)
+            _folders_ensured = True
 
 
 async def _publish_to_github(
@@ -104,6 +169,8 @@ async def _publish_to_github(
     ai_result: dict,
     item_id: int,
     message,
+    stored_markdown: str | None = None,
+    stored_path: str | None = None,
 ) -> None:
     """Restructure content with AI, then publish to GitHub via the publisher agent.
 
@@ -113,62 +180,78 @@ async def _publish_to_github(
     try:
         await message.reply_text("Publishing to GitHub...")
 
-        # AI restructures content and suggests paths
-        restructured = await asyncio.to_thread(
-            restructure_for_github,
-            text=text,
-            content_type=content_type,
-            original_name=original_name,
-            tags=ai_result["tags"],
-            summary=ai_result["summary"],
-            topic=ai_result["topic"],
-        )
-
-        # Application determines the GitHub folder
-        github_folder = CONTENT_TYPE_TO_GITHUB_FOLDER.get(content_type, "notes")
-        folder_path = f"{github_folder}/{restructured['suggested_subfolder']}"
-
-        # Application ensures repo folders exist
-        await asyncio.to_thread(ensure_repo_folders)
-
-        # Application publishes the restructured markdown
-        github_url = await asyncio.to_thread(
-            publish_text_content,
-            folder_path=folder_path,
-            filename=restructured["suggested_filename"],
-            content=restructured["markdown"],
-            commit_message=restructured["commit_message"],
-        )
-
-        # For binary content (images, PDFs), also publish the raw file
-        if raw_bytes and content_type in ("images", "documents"):
-            await asyncio.to_thread(
-                publish_binary_content,
-                folder_path=folder_path,
-                filename=original_name,
-                data=raw_bytes,
-                commit_message=f"Add raw file: {original_name}",
+        if stored_markdown and stored_path:
+            # Reuse the memoized restructure from an earlier attempt —
+            # identical input, identical output, no LLM round-trip
+            await _ensure_repo_folders_once()
+            markdown = stored_markdown
+            markdown_path = stored_path
+            commit_message = f"Add {content_type}: {original_name}"
+        else:
+            # AI restructuring and the top-level folder check are
+            # independent — overlap the LLM call with the GitHub probes
+            restructured, _ = await asyncio.gather(
+                restructure_for_github_async(
+                    text=text,
+                    content_type=content_type,
+                    original_name=original_name,
+                    tags=ai_result["tags"],
+                    summary=ai_result["summary"],
+                    topic=ai_result["topic"],
+                ),
+                _ensure_repo_folders_once(),
             )
 
-        # Application updates database with GitHub status
-        await asyncio.to_thread(db.update_github_status, item_id, github_url)
-
-        await message.reply_text(f"Published to GitHub: {github_url}")
-
-    except Exception:
-        logger.exception("GitHub publishing failed for item %s", item_id)
+            # Application determines the GitHub folder
+            github_folder = CONTENT_TYPE_TO_GITHUB_FOLDER.get(content_type, "notes")
+            folder_path = f"{github_folder}/{restructured['suggested_subfolder']}"
+            markdown = restructured["markdown"]
+            markdown_path = f"{folder_path}/{restructured['suggested_filename']}"
+            commit_message = restructured["commit_message"]
+
+            # Memoize for publish retries
+            await db.update_restructure_cache_async(item_id, markdown, markdown_path)
+
+        # Application publishes the restructured markdown (and the raw file
+        # for binary content) as a single Git Data commit
+        files = [(markdown_path, markdown.encode("utf-8"))]
+        if raw_bytes and content_type in _BINARY_CONTENT_TYPES:
+            folder_path = markdown_path.rsplit("/", 1)[0]
+            files.append((f"{folder_path}/{original_name}", raw_bytes))
+
+        github_url = await _run_io(publish_files, files, commit_message)
+
+        # Status write and user reply are independent — overlap them
+        await asyncio.gather(
+            db.update_github_status_async(item_id, github_url),
+            message.reply_text(f"Published to GitHub: {github_url}"),
+        )
+
+    except Exception as exc:
+        # Publish failures are common (network, rate limits) — log the
+        # exception type/message at WARNING and only pay for traceback
+        # formatting when DEBUG is on. Unexpected handler errors elsewhere
+        # keep full logger.exception treatment.
+        logger.warning(
+            "GitHub publishing failed for item %s: %s",
+            item_id,
+            exc,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
         await message.reply_text("GitHub publishing failed. Content is saved locally.")
 
 
 # ── /start ──────────────────────────────────────────────────────────────────
 
 
-async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
-    await update.effective_message.reply_text(  # type: ignore[union-attr]
+@authorized
+async def start_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
+    await message.reply_text(
         "Welcome to Brain Box!\n\n"
         "Send me documents, images, links, or text and I'll organize them for you.\n\n"
         "Commands:\n"
@@ -184,12 +267,14 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 # ── /help ───────────────────────────────────────────────────────────────────
 
 
-async def help_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
-    await update.effective_message.reply_text(  # type: ignore[union-attr]
+@authorized
+async def help_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
+    await message.reply_text(
         "Brain Box — Your personal knowledge assistant\n\n"
         "Just send me any content:\n"
         "  - PDF / DOCX documents\n"
@@ -213,155 +298,158 @@ async def help_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 # ── /list ───────────────────────────────────────────────────────────────────
 
 
-async def list_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
+@authorized
+async def list_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
     if not context.args:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
+        await message.reply_text(
             "Usage: /list <type>\nTypes: images, documents, links, notes"
         )
         return
 
     content_type = context.args[0].lower()
-    if content_type not in ("images", "documents", "links", "notes"):
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
+    if content_type not in VALID_CONTENT_TYPES:
+        await message.reply_text(
             "Invalid type. Choose from: images, documents, links, notes"
         )
         return
 
-    items = db.list_by_content_type(content_type)
+    # Fetch one beyond the display cap so the header can say "20+"
+    items = await db.list_by_content_type_async(content_type, limit=21)
     if not items:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
-            f"No {content_type} found."
-        )
+        await message.reply_text(f"No {content_type} found.")
         return
 
-    lines = [f"Your {content_type} ({len(items)} items):\n"]
-    for item in items[:20]:  # Limit to 20 items in response
-        tags = item.tags or "—"
-        summary = item.summary or "—"
-        gh_status = " [GH]" if item.github_published else ""
-        lines.append(
-            f"• {item.original_name}{gh_status}\n"
-            f"  Tags: {tags}\n"
-            f"  Summary: {summary}\n"
-        )
-
-    await update.effective_message.reply_text("\n".join(lines))  # type: ignore[union-attr]
+    count_label = "20+" if len(items) == 21 else str(len(items))
+    # Single join over a generator instead of growing a list per item
+    body = "\n".join(
+        f"• {item.original_name}{' [GH]' if item.github_published else ''}\n"
+        f"  Tags: {', '.join(item.tags) if item.tags else '—'}\n"
+        f"  Summary: {item.summary or '—'}\n"
+        for item in items[:20]
+    )
+    await message.reply_text(f"Your {content_type} ({count_label} items):\n\n{body}")
 
 
 # ── /search ─────────────────────────────────────────────────────────────────
 
 
-async def search_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
+@authorized
+async def search_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
     if not context.args:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
-            "Usage: /search <keyword>"
-        )
+        await message.reply_text("Usage: /search <keyword>")
         return
 
     keyword = " ".join(context.args)
-    items = db.search_by_keyword(keyword)
+    items = await db.search_by_keyword_async(keyword, limit=21)
 
     if not items:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
-            f'No results for "{keyword}".'
-        )
+        await message.reply_text(f'No results for "{keyword}".')
         return
 
-    lines = [f'Search results for "{keyword}" ({len(items)} items):\n']
-    for item in items[:20]:
-        lines.append(
-            f"• [{item.content_type}] {item.original_name}\n"
-            f"  Tags: {item.tags or '—'}\n"
-        )
-
-    await update.effective_message.reply_text("\n".join(lines))  # type: ignore[union-attr]
+    count_label = "20+" if len(items) == 21 else str(len(items))
+    body = "\n".join(
+        f"• [{item.content_type}] {item.original_name}\n"
+        f"  Tags: {', '.join(item.tags) if item.tags else '—'}\n"
+        for item in items[:20]
+    )
+    await message.reply_text(
+        f'Search results for "{keyword}" ({count_label} items):\n\n{body}'
+    )
 
 
 # ── /date ───────────────────────────────────────────────────────────────────
 
 
-async def date_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
+@authorized
+async def date_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
     if not context.args:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
-            "Usage: /date <YYYY-MM-DD>"
-        )
+        await message.reply_text("Usage: /date <YYYY-MM-DD>")
         return
 
     try:
-        target_date = datetime.strptime(context.args[0], "%Y-%m-%d").date()
+        # Direct C-level ISO parser — no format-string interpretation
+        target_date = date.fromisoformat(context.args[0])
     except ValueError:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
-            "Invalid date format. Use YYYY-MM-DD."
-        )
+        await message.reply_text("Invalid date format. Use YYYY-MM-DD.")
         return
 
-    items = db.filter_by_date(target_date)
+    items = await db.filter_by_date_async(target_date, limit=21)
 
     if not items:
-        await update.effective_message.reply_text(  # type: ignore[union-attr]
-            f"No items found for {target_date}."
-        )
+        await message.reply_text(f"No items found for {target_date}.")
         return
 
-    lines = [f"Items from {target_date} ({len(items)} items):\n"]
-    for item in items[:20]:
-        lines.append(
-            f"• [{item.content_type}] {item.original_name}\n"
-            f"  Tags: {item.tags or '—'}\n"
-        )
-
-    await update.effective_message.reply_text("\n".join(lines))  # type: ignore[union-attr]
+    count_label = "20+" if len(items) == 21 else str(len(items))
+    body = "\n".join(
+        f"• [{item.content_type}] {item.original_name}\n"
+        f"  Tags: {', '.join(item.tags) if item.tags else '—'}\n"
+        for item in items[:20]
+    )
+    await message.reply_text(
+        f"Items from {target_date} ({count_label} items):\n\n{body}"
+    )
 
 
 # ── /publish ────────────────────────────────────────────────────────────────
 
 
-async def publish_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@authorized
+async def publish_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
     """Publish the most recent unpublished item to GitHub."""
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
-    message = update.effective_message
-    if not message:
-        return
-
-    items = await asyncio.to_thread(db.get_latest_unpublished)
+    items = await db.get_latest_unpublished_async()
     if not items:
         await message.reply_text("No unpublished items found.")
         return
 
     item = items[0]
 
-    # Read the stored file content for AI restructuring
+    # Read the stored content for AI restructuring. Text types decode
+    # straight from disk without holding a bytes copy; raw bytes are
+    # loaded only for the binary types that republish the original file.
     text = ""
     raw_bytes = None
     file_path = Path(item.file_path)
-    if file_path.exists():
-        raw_bytes = file_path.read_bytes()
+    try:
+        # EAFP: open directly rather than stat-then-open — one syscall
+        # fewer and no TOCTOU window if the file vanishes in between
         if item.content_type in ("notes", "links"):
-            text = raw_bytes.decode("utf-8", errors="replace")
+            text = await _run_io(
+                functools.partial(
+                    file_path.read_text, encoding="utf-8", errors="replace"
+                )
+            )
         elif item.content_type == "documents":
-            text = await asyncio.to_thread(extract_text, item.content_type, raw_bytes)
+            raw_bytes = await _run_io(file_path.read_bytes)
+            text = await _run_cpu(extract_text, item.content_type, raw_bytes)
         elif item.content_type == "images":
+            raw_bytes = await _run_io(file_path.read_bytes)
             text = item.summary or ""
-    else:
+    except FileNotFoundError:
+        raw_bytes = None
         text = item.summary or ""
 
     ai_result = {
-        "tags": (item.tags or "").split(", "),
+        "tags": item.tags or [],
         "summary": item.summary or "",
         "topic": item.topic or "general",
     }
@@ -374,19 +462,22 @@ async def publish_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         ai_result=ai_result,
         item_id=item.id,
         message=message,
+        stored_markdown=item.restructured_markdown,
+        stored_path=item.suggested_path,
     )
 
 
 # ── Document handler ────────────────────────────────────────────────────────
 
 
-async def document_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
-    message = update.effective_message
-    if not message or not message.document:
+@authorized
+async def document_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
+    if not message.document:
         return
 
     doc = message.document
@@ -394,56 +485,66 @@ async def document_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     content_type = detect_content_type(original_name, doc.mime_type)
 
     # Check for publish trigger in caption
-    should_publish = _has_publish_trigger(message.caption)
+    should_publish = bool(
+        message.caption and GITHUB_TRIGGER_PATTERN.search(message.caption)
+    )
 
     await message.reply_text(f"Received {content_type}: {original_name}\nProcessing...")
 
     try:
-        # Step 1: Download raw file
+        # Steps 1+2: stream the download straight to its storage location —
+        # no bytearray buffer and no extra bytes() copy in between
         tg_file = await doc.get_file()
-        data = await tg_file.download_as_bytearray()
-        raw_bytes = bytes(data)
-
-        # Step 2: Save raw file to disk BEFORE AI processing
-        file_path = await asyncio.to_thread(
-            save_file,
+        file_path = await _run_io(
+            reserve_file_path,
             content_type=content_type,
             topic="general",
             telegram_message_id=message.message_id,
             original_name=original_name,
-            data=raw_bytes,
         )
+        await tg_file.download_to_drive(custom_path=str(file_path))
 
-        # Step 3: Extract text
-        text = await asyncio.to_thread(extract_text, content_type, raw_bytes)
+        # Step 3: Extract text from the stored file
+        text = await _run_cpu(_extract_stored_text, content_type, file_path)
 
         # Step 4: AI analysis
-        ai_result = await asyncio.to_thread(analyze_content, text, content_type)
+        ai_result = await analyze_content_async(text, content_type)
+        tags_str = ", ".join(ai_result["tags"])
 
-        # Step 5: Store metadata in database
-        db_item = await asyncio.to_thread(
-            db.save_content_item,
+        # Step 5: AI publish decision, then the content item
+        # and its decision persisted in a single transaction
+        decision = await make_publish_decision_async(
             content_type=content_type,
-            file_path=str(file_path),
-            original_name=original_name,
-            telegram_message_id=message.message_id,
-            telegram_user_id=update.effective_user.id,
-            tags=", ".join(ai_result["tags"]),
+            has_trigger=should_publish,
+            tags=ai_result["tags"],
             summary=ai_result["summary"],
             topic=ai_result["topic"],
         )
-
-        # Step 5.5: Make and persist decision
-        decision = await _make_and_persist_decision(
-            content_type=content_type,
-            has_trigger=should_publish,
-            ai_result=ai_result,
-            item_id=db_item.id,
-            telegram_message_id=message.message_id,
+        db_item, _ = await db.save_item_with_decision_async(
+            item_fields=dict(
+                content_type=content_type,
+                file_path=str(file_path),
+                original_name=original_name,
+                telegram_message_id=message.message_id,
+                telegram_user_id=user_id,
+                tags=ai_result["tags"],
+                summary=ai_result["summary"],
+                topic=ai_result["topic"],
+            ),
+            decision_fields=_decision_fields(
+                decision=decision,
+                content_type=content_type,
+                has_trigger=should_publish,
+                ai_result=ai_result,
+                tags_str=tags_str,
+                telegram_message_id=message.message_id,
+            ),
         )
 
-        # Step 6: Publish to GitHub if decision recommends it
+        # Step 6: Publish to GitHub if decision recommends it; the raw
+        # bytes are only read back from disk when actually publishing
         if decision["recommendation"] == "publish_to_github":
+            raw_bytes = await _run_io(file_path.read_bytes)
             await _publish_to_github(
                 content_type=content_type,
                 original_name=original_name,
@@ -459,7 +560,7 @@ async def document_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             f"Saved: {original_name}\n"
             f"Type: {content_type}\n"
             f"Topic: {ai_result['topic']}\n"
-            f"Tags: {', '.join(ai_result['tags'])}\n"
+            f"Tags: {tags_str}\n"
             f"Summary: {ai_result['summary']}"
         )
 
@@ -476,13 +577,14 @@ async def document_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 # ── Photo handler ───────────────────────────────────────────────────────────
 
 
-async def photo_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
-    message = update.effective_message
-    if not message or not message.photo:
+@authorized
+async def photo_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
+    if not message.photo:
         return
 
     # Get the highest resolution photo
@@ -491,63 +593,70 @@ async def photo_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     content_type = "images"
 
     # Check for publish trigger in caption
-    should_publish = _has_publish_trigger(message.caption)
+    should_publish = bool(
+        message.caption and GITHUB_TRIGGER_PATTERN.search(message.caption)
+    )
 
     await message.reply_text("Received image. Processing...")
 
     try:
-        # Step 1: Download
+        # Steps 1+2: stream the download straight to its storage location
         tg_file = await photo.get_file()
-        data = await tg_file.download_as_bytearray()
-        raw_bytes = bytes(data)
-
-        # Step 2: Save raw file
-        file_path = await asyncio.to_thread(
-            save_file,
+        file_path = await _run_io(
+            reserve_file_path,
             content_type=content_type,
             topic="general",
             telegram_message_id=message.message_id,
             original_name=original_name,
-            data=raw_bytes,
         )
+        await tg_file.download_to_drive(custom_path=str(file_path))
 
         # Step 3: Caption text for AI analysis
         caption_text = message.caption or ""
         if caption_text:
-            ai_result = await asyncio.to_thread(
-                analyze_content, caption_text, content_type
-            )
+            ai_result = await analyze_content_async(caption_text, content_type)
         else:
             ai_result = {
                 "tags": ["image"],
                 "summary": "Image received without caption.",
                 "topic": "general",
             }
+        tags_str = ", ".join(ai_result["tags"])
 
-        # Step 4: Store metadata
-        db_item = await asyncio.to_thread(
-            db.save_content_item,
+        # Step 4: AI publish decision, then the content item
+        # and its decision persisted in a single transaction
+        decision = await make_publish_decision_async(
             content_type=content_type,
-            file_path=str(file_path),
-            original_name=original_name,
-            telegram_message_id=message.message_id,
-            telegram_user_id=update.effective_user.id,
-            tags=", ".join(ai_result["tags"]),
+            has_trigger=should_publish,
+            tags=ai_result["tags"],
             summary=ai_result["summary"],
             topic=ai_result["topic"],
         )
-
-        # Step 4.5: Make and persist decision
-        decision = await _make_and_persist_decision(
-            content_type=content_type,
-            has_trigger=should_publish,
-            ai_result=ai_result,
-            item_id=db_item.id,
-            telegram_message_id=message.message_id,
+        db_item, _ = await db.save_item_with_decision_async(
+            item_fields=dict(
+                content_type=content_type,
+                file_path=str(file_path),
+                original_name=original_name,
+                telegram_message_id=message.message_id,
+                telegram_user_id=user_id,
+                tags=ai_result["tags"],
+                summary=ai_result["summary"],
+                topic=ai_result["topic"],
+            ),
+            decision_fields=_decision_fields(
+                decision=decision,
+                content_type=content_type,
+                has_trigger=should_publish,
+                ai_result=ai_result,
+                tags_str=tags_str,
+                telegram_message_id=message.message_id,
+            ),
         )
 
-        # Step 5: Publish to GitHub if decision recommends it
+        # Step 5: Publish to GitHub if decision recommends it; read the
+        # raw bytes back from disk only when actually publishing
         if decision["recommendation"] == "publish_to_github":
+            raw_bytes = await _run_io(file_path.read_bytes)
             await _publish_to_github(
                 content_type=content_type,
                 original_name=original_name,
@@ -561,7 +670,7 @@ async def photo_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await message.reply_text(
             "Saved image.\n"
             f"Topic: {ai_result['topic']}\n"
-            f"Tags: {', '.join(ai_result['tags'])}\n"
+            f"Tags: {tags_str}\n"
             f"Summary: {ai_result['summary']}"
         )
 
@@ -578,80 +687,96 @@ async def photo_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 # ── Text / Link handler ────────────────────────────────────────────────────
 
 
-async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    if not update.effective_user or not _is_authorized(update.effective_user.id):
-        await _reject_unauthorized(update)
-        return
-
-    message = update.effective_message
-    if not message or not message.text:
+@authorized
+async def text_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    message,
+    user_id: int,
+) -> None:
+    if not message.text:
         return
 
     text = message.text.strip()
     if not text:
         return
 
-    # Detect if this is a URL
-    urls = URL_PATTERN.findall(text)
+    # One combined scan finds every URL and the #github trigger. The
+    # C-level substring checks short-circuit the regex for plain notes.
+    urls: list[str] = []
+    should_publish = False
+    if "http" in text or "#" in text:
+        for match in COMBINED_PATTERN.finditer(text):
+            if match.group("url"):
+                urls.append(match.group("url"))
+            else:
+                should_publish = True
 
     if urls:
-        await _handle_link(update, message, text, urls[0])
+        await _handle_link(message, text, urls, should_publish, user_id)
     else:
-        await _handle_note(update, message, text)
+        await _handle_note(message, text, should_publish, user_id)
 
 
-async def _handle_link(update, message, text, url):
+async def _handle_link(message, text, urls, should_publish, user_id):
     content_type = "links"
+    url = urls[0]
     original_name = url[:100]
 
-    # Check for publish trigger
-    should_publish = _has_publish_trigger(text)
-
     await message.reply_text("Received link. Processing...")
 
     try:
-        # Step 1: Save the raw link text
-        file_path = await asyncio.to_thread(
-            save_text_content,
-            content_type=content_type,
-            topic="general",
-            telegram_message_id=message.message_id,
-            original_name=f"link_{message.message_id}.txt",
-            text=text,
+        # Steps 1+2: saving the raw link text and fetching the URLs are
+        # independent non-AI legs — overlap them
+        file_path, extracted_parts = await asyncio.gather(
+            _run_io(
+                save_text_content,
+                content_type=content_type,
+                topic="general",
+                telegram_message_id=message.message_id,
+                original_name=f"link_{message.message_id}.txt",
+                text=text,
+            ),
+            extract_texts_from_urls(urls),
         )
-
-        # Step 2: Extract text from URL
-        extracted = await asyncio.to_thread(extract_text, "links", None, url)
+        extracted = "\n\n".join(part for part in extracted_parts if part)
 
         # Step 3: AI analysis
         if extracted:
             combined_text = f"URL: {url}\n\n{extracted}"
         else:
             combined_text = f"URL: {url}\n\n{text}"
-        ai_result = await asyncio.to_thread(
-            analyze_content, combined_text, content_type
-        )
+        ai_result = await analyze_content_async(combined_text, content_type)
+        tags_str = ", ".join(ai_result["tags"])
 
-        # Step 4: Store metadata
-        db_item = await asyncio.to_thread(
-            db.save_content_item,
+        # Step 4: AI publish decision, then the content item
+        # and its decision persisted in a single transaction
+        decision = await make_publish_decision_async(
             content_type=content_type,
-            file_path=str(file_path),
-            original_name=original_name,
-            telegram_message_id=message.message_id,
-            telegram_user_id=update.effective_user.id,
-            tags=", ".join(ai_result["tags"]),
+            has_trigger=should_publish,
+            tags=ai_result["tags"],
             summary=ai_result["summary"],
             topic=ai_result["topic"],
         )
-
-        # Step 4.5: Make and persist decision
-        decision = await _make_and_persist_decision(
-            content_type=content_type,
-            has_trigger=should_publish,
-            ai_result=ai_result,
-            item_id=db_item.id,
-            telegram_message_id=message.message_id,
+        db_item, _ = await db.save_item_with_decision_async(
+            item_fields=dict(
+                content_type=content_type,
+                file_path=str(file_path),
+                original_name=original_name,
+                telegram_message_id=message.message_id,
+                telegram_user_id=user_id,
+                tags=ai_result["tags"],
+                summary=ai_result["summary"],
+                topic=ai_result["topic"],
+            ),
+            decision_fields=_decision_fields(
+                decision=decision,
+                content_type=content_type,
+                has_trigger=should_publish,
+                ai_result=ai_result,
+                tags_str=tags_str,
+                telegram_message_id=message.message_id,
+            ),
         )
 
         # Step 5: Publish to GitHub if decision recommends it
@@ -669,7 +794,7 @@ async def _handle_link(update, message, text, url):
         await message.reply_text(
             f"Saved link.\n"
             f"Topic: {ai_result['topic']}\n"
-            f"Tags: {', '.join(ai_result['tags'])}\n"
+            f"Tags: {tags_str}\n"
             f"Summary: {ai_result['summary']}"
         )
 
@@ -681,18 +806,15 @@ async def _handle_link(update, message, text, url):
         )
 
 
-async def _handle_note(update, message, text):
+async def _handle_note(message, text, should_publish, user_id):
     content_type = "notes"
     original_name = f"note_{message.message_id}.txt"
 
-    # Check for publish trigger
-    should_publish = _has_publish_trigger(text)
-
     await message.reply_text("Received note. Processing...")
 
     try:
         # Step 1: Save raw text
-        file_path = await asyncio.to_thread(
+        file_path = await _run_io(
             save_text_content,
             content_type=content_type,
             topic="general",
@@ -702,28 +824,37 @@ async def _handle_note(update, message, text):
         )
 
         # Step 2: AI analysis
-        ai_result = await asyncio.to_thread(analyze_content, text, content_type)
+        ai_result = await analyze_content_async(text, content_type)
+        tags_str = ", ".join(ai_result["tags"])
 
-        # Step 3: Store metadata
-        db_item = await asyncio.to_thread(
-            db.save_content_item,
+        # Step 3: AI publish decision, then the content item
+        # and its decision persisted in a single transaction
+        decision = await make_publish_decision_async(
             content_type=content_type,
-            file_path=str(file_path),
-            original_name=original_name,
-            telegram_message_id=message.message_id,
-            telegram_user_id=update.effective_user.id,
-            tags=", ".join(ai_result["tags"]),
+            has_trigger=should_publish,
+            tags=ai_result["tags"],
             summary=ai_result["summary"],
             topic=ai_result["topic"],
         )
-
-        # Step 3.5: Make and persist decision
-        decision = await _make_and_persist_decision(
-            content_type=content_type,
-            has_trigger=should_publish,
-            ai_result=ai_result,
-            item_id=db_item.id,
-            telegram_message_id=message.message_id,
+        db_item, _ = await db.save_item_with_decision_async(
+            item_fields=dict(
+                content_type=content_type,
+                file_path=str(file_path),
+                original_name=original_name,
+                telegram_message_id=message.message_id,
+                telegram_user_id=user_id,
+                tags=ai_result["tags"],
+                summary=ai_result["summary"],
+                topic=ai_result["topic"],
+            ),
+            decision_fields=_decision_fields(
+                decision=decision,
+                content_type=content_type,
+                has_trigger=should_publish,
+                ai_result=ai_result,
+                tags_str=tags_str,
+                telegram_message_id=message.message_id,
+            ),
         )
 
         # Step 4: Publish to GitHub if decision recommends it
@@ -741,7 +872,7 @@ async def _handle_note(update, message, text):
         await message.reply_text(
             f"Saved note.\n"
             f"Topic: {ai_result['topic']}\n"
-            f"Tags: {', '.join(ai_result['tags'])}\n"
+            f"Tags: {tags_str}\n"
             f"Summary: {ai_result['summary']}"
         )
 
@@ -1,18 +1,84 @@
 import os
+import tempfile
 
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-# Set test environment variables BEFORE any app imports
+# Set test environment variables BEFORE any app imports — settings exits
+# at import when any required var is missing, so the suite must be
+# self-contained. Storage and database point at a throwaway temp root.
+_TEST_ROOT = tempfile.mkdtemp(prefix="brain-box-tests-")
 os.environ.setdefault("TELEGRAM_BOT_TOKEN", "test-token-123")
 os.environ.setdefault("TELEGRAM_ALLOWED_USER_ID", "12345")
 os.environ.setdefault("OPENAI_API_KEY", "test-openai-key")
 os.environ.setdefault("ENVIRONMENT", "test")
 os.environ.setdefault("GITHUB_TOKEN", "test-github-token")
 os.environ.setdefault("GITHUB_DEFAULT_REPO", "test-owner/test-repo")
+os.environ.setdefault("STORAGE_BASE_PATH", os.path.join(_TEST_ROOT, "storage"))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(_TEST_ROOT, 'test.db')}"
+)
+
+
+def apply_fast_sqlite_pragmas(engine) -> None:
+    """Throwaway test databases don't need durability — drop the fsync
+    and journal costs from every commit."""
+
+    @event.listens_for(engine, "connect")
+    def _fast_pragmas(dbapi_conn, _connection_record):
+        cursor = dbapi_conn.cursor()
+        for pragma in ("journal_mode=MEMORY", "synchronous=OFF", "temp_store=MEMORY"):
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """One in-memory engine for the whole run — DDL executes once instead
+    of rebuilding a file-backed schema (and paying its fsyncs) per test."""
+    from app.database.models import Base
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    apply_fast_sqlite_pragmas(engine)
+    Base.metadata.create_all(engine)
+    # No dispose teardown: an in-memory engine holds no file descriptors
+    # worth releasing and dies with the process
+    return engine
 
 
 @pytest.fixture
-def tmp_storage(tmp_path):
-    os.environ["STORAGE_BASE_PATH"] = str(tmp_path / "storage")
-    os.environ["DATABASE_URL"] = f"sqlite:///{tmp_path / 'test.db'}"
-    return tmp_path / "storage"
+def db_session(engine):
+    """Session wrapped in an outer transaction that rolls back after the
+    test; commits inside the test only release savepoints."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preimport_agents():
+    """Pay the heavy agent imports (OpenAI and GitHub client stacks) once
+    up front — per worker under xdist — instead of inside whichever test
+    happens to touch them first."""
+    import app.agents.content_restructurer  # noqa: F401
+    import app.agents.github_publisher  # noqa: F401
+
+
+@pytest.fixture(autouse=True)
+def _reset_repository_read_cache():
+    """Keep the repository's TTL read cache from leaking rows across tests
+    that swap the module-level engine."""
+    yield
+    from app.database import repository
+
+    repository._invalidate_read_cache()
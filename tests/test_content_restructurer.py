@@ -1,4 +1,6 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock
+
+import pytest
 
 from app.agents.content_restructurer import (
     _build_default_markdown,
@@ -7,39 +9,90 @@ from app.agents.content_restructurer import (
     restructure_for_github,
 )
 
-
-def test_fallback_result_structure():
-    """Test fallback produces all required keys."""
-    result = _fallback_result(
+# Shared baseline inputs for the validate/fallback families
+_BASE_VALIDATE_INPUT = {
+    "markdown": "# Test",
+    "suggested_subfolder": "general",
+    "suggested_filename": "test.md",
+    "commit_message": "Add test",
+}
+
+
+@pytest.mark.parametrize(
+    ("override", "check"),
+    [
+        pytest.param(
+            {"suggested_subfolder": "My Folder!@#"},
+            lambda r: all(c.isalnum() or c == "-" for c in r["suggested_subfolder"]),
+            id="sanitizes-subfolder",
+        ),
+        pytest.param(
+            {"suggested_filename": "test.txt"},
+            lambda r: r["suggested_filename"].endswith(".md"),
+            id="ensures-md-extension",
+        ),
+        pytest.param(
+            {"commit_message": "A" * 200},
+            lambda r: len(r["commit_message"]) <= 120,
+            id="truncates-commit-message",
+        ),
+    ],
+)
+def test_validate_result(override, check):
+    result = _validate_result(
+        result={**_BASE_VALIDATE_INPUT, **override},
         content_type="notes",
-        original_name="test_note.txt",
-        tags=["test", "demo"],
-        summary="A test note.",
-        topic="general",
-    )
-
-    assert "markdown" in result
-    assert "suggested_subfolder" in result
-    assert "suggested_filename" in result
-    assert "commit_message" in result
-    assert result["suggested_subfolder"] == "general"
-    assert result["suggested_filename"].endswith(".md")
-    assert "notes" in result["commit_message"]
-
-
-def test_fallback_result_sanitizes_filename():
-    """Test fallback handles special characters in filenames."""
-    result = _fallback_result(
-        content_type="documents",
-        original_name="My Document (Final).pdf",
-        tags=["doc"],
+        original_name="test.txt",
+        tags=["test"],
         summary="Summary",
-        topic="work",
     )
-
-    assert " " not in result["suggested_filename"]
-    assert "(" not in result["suggested_filename"]
-    assert result["suggested_filename"].endswith(".md")
+    assert check(result)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "check"),
+    [
+        pytest.param(
+            {
+                "content_type": "notes",
+                "original_name": "test_note.txt",
+                "tags": ["test", "demo"],
+                "summary": "A test note.",
+                "topic": "general",
+            },
+            lambda r: (
+                {
+                    "markdown",
+                    "suggested_subfolder",
+                    "suggested_filename",
+                    "commit_message",
+                }
+                <= set(r)
+                and r["suggested_subfolder"] == "general"
+                and r["suggested_filename"].endswith(".md")
+                and "notes" in r["commit_message"]
+            ),
+            id="structure",
+        ),
+        pytest.param(
+            {
+                "content_type": "documents",
+                "original_name": "My Document (Final).pdf",
+                "tags": ["doc"],
+                "summary": "Summary",
+                "topic": "work",
+            },
+            lambda r: (
+                " " not in r["suggested_filename"]
+                and "(" not in r["suggested_filename"]
+                and r["suggested_filename"].endswith(".md")
+            ),
+            id="sanitizes-filename",
+        ),
+    ],
+)
+def test_fallback_result(kwargs, check):
+    assert check(_fallback_result(**kwargs))
 
 
 def test_build_default_markdown():
@@ -56,65 +109,11 @@ def test_build_default_markdown():
     assert "`code`" in md
 
 
-def test_validate_result_sanitizes_subfolder():
-    """Test validation sanitizes subfolder names."""
-    result = _validate_result(
-        result={
-            "markdown": "# Test",
-            "suggested_subfolder": "My Folder!@#",
-            "suggested_filename": "test.md",
-            "commit_message": "Add test",
-        },
-        content_type="notes",
-        original_name="test.txt",
-        tags=["test"],
-        summary="Summary",
-    )
-
-    # Special characters should be replaced with hyphens
-    assert all(c.isalnum() or c == "-" for c in result["suggested_subfolder"])
-
-
-def test_validate_result_ensures_md_extension():
-    """Test validation ensures .md extension on filename."""
-    result = _validate_result(
-        result={
-            "markdown": "# Test",
-            "suggested_subfolder": "general",
-            "suggested_filename": "test.txt",
-            "commit_message": "Add test",
-        },
-        content_type="notes",
-        original_name="test.txt",
-        tags=["test"],
-        summary="Summary",
-    )
-
-    assert result["suggested_filename"].endswith(".md")
-
-
-def test_validate_result_truncates_commit_message():
-    """Test validation truncates long commit messages."""
-    long_msg = "A" * 200
-    result = _validate_result(
-        result={
-            "markdown": "# Test",
-            "suggested_subfolder": "general",
-            "suggested_filename": "test.md",
-            "commit_message": long_msg,
-        },
-        content_type="notes",
-        original_name="test.txt",
-        tags=["test"],
-        summary="Summary",
-    )
-
-    assert len(result["commit_message"]) <= 120
-
-
-@patch("app.agents.content_restructurer._client")
-def test_restructure_for_github_empty_text(mock_client):
+def test_restructure_for_github_empty_text(monkeypatch):
     """Test restructure falls back gracefully for empty text."""
+    mock_client = MagicMock()
+    monkeypatch.setattr("app.agents.content_restructurer._client", mock_client)
+
     result = restructure_for_github(
         text="",
         content_type="notes",
@@ -128,10 +127,11 @@ def test_restructure_for_github_empty_text(mock_client):
     mock_client.chat.completions.create.assert_not_called()
 
 
-@patch("app.agents.content_restructurer._client")
-def test_restructure_for_github_api_failure(mock_client):
+def test_restructure_for_github_api_failure(monkeypatch):
     """Test restructure falls back gracefully on API failure."""
+    mock_client = MagicMock()
     mock_client.chat.completions.create.side_effect = Exception("API error")
+    monkeypatch.setattr("app.agents.content_restructurer._client", mock_client)
 
     result = restructure_for_github(
         text="Some content to restructure.",
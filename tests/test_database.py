@@ -1,36 +1,37 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
 
-from app.database.models import Base, ContentItem
+from app.database.models import ContentItem
 
+# Built once; the literal filter never changes
+_IMAGES_STMT = select(ContentItem).where(ContentItem.content_type == "images")
 
-def test_content_item_model(tmp_path):
-    db_path = tmp_path / "test.db"
-    engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(engine)
+# Baseline column values; tests override only what they assert on
+_DEFAULT_ITEM = {
+    "content_type": "notes",
+    "file_path": "/tmp/test.txt",
+    "original_name": "test.txt",
+    "telegram_message_id": 123,
+    "telegram_user_id": 456,
+    "tags": ["test", "demo"],
+    "summary": "A test note.",
+    "topic": "general",
+}
 
-    with Session(engine) as session:
-        item = ContentItem(
-            content_type="notes",
-            file_path="/tmp/test.txt",
-            original_name="test.txt",
-            telegram_message_id=123,
-            telegram_user_id=456,
-            tags="test, demo",
-            summary="A test note.",
-            topic="general",
-        )
-        session.add(item)
-        session.commit()
-        session.refresh(item)
 
-        assert item.id is not None
-        assert item.content_type == "notes"
-        assert item.original_name == "test.txt"
-        assert item.tags == "test, demo"
+def test_content_item_model(db_session):
+    item = ContentItem(**_DEFAULT_ITEM)
+    db_session.add(item)
+    # No refresh needed: the PK is populated at flush and the asserted
+    # attributes were set locally
+    db_session.commit()
 
+    assert item.id is not None
+    assert item.content_type == "notes"
+    assert item.original_name == "test.txt"
+    assert item.tags == ["test", "demo"]
 
-def test_content_item_repr(tmp_path):
+
+def test_content_item_repr():
     item = ContentItem(
         id=1,
         content_type="documents",
@@ -43,36 +44,23 @@ def test_content_item_repr(tmp_path):
     assert "documents" in repr(item)
 
 
-def test_query_by_content_type(tmp_path):
-    db_path = tmp_path / "test.db"
-    engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(engine)
-
-    with Session(engine) as session:
-        for i in range(3):
-            session.add(
-                ContentItem(
-                    content_type="images",
-                    file_path=f"/tmp/img{i}.jpg",
-                    original_name=f"img{i}.jpg",
-                    telegram_message_id=i,
-                    telegram_user_id=1,
-                )
-            )
-        session.add(
-            ContentItem(
-                content_type="notes",
-                file_path="/tmp/note.txt",
-                original_name="note.txt",
-                telegram_message_id=99,
-                telegram_user_id=1,
-            )
-        )
-        session.commit()
-
-    from sqlalchemy import select
+def test_query_by_content_type(db_session):
+    # Single multi-row INSERT instead of per-row ORM bookkeeping
+    db_session.execute(
+        insert(ContentItem),
+        [
+            {
+                **_DEFAULT_ITEM,
+                "content_type": "images",
+                "file_path": f"/tmp/img{i}.jpg",
+                "original_name": f"img{i}.jpg",
+                "telegram_message_id": i,
+            }
+            for i in range(3)
+        ]
+        + [{**_DEFAULT_ITEM, "telegram_message_id": 99}],
+    )
+    db_session.commit()
 
-    with Session(engine) as session:
-        stmt = select(ContentItem).where(ContentItem.content_type == "images")
-        results = list(session.scalars(stmt).all())
-        assert len(results) == 3
+    results = db_session.scalars(_IMAGES_STMT).all()
+    assert len(results) == 3
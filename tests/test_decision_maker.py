@@ -1,3 +1,5 @@
+import pytest
+
 from app.agents.decision_maker import (
     _fallback_decision,
     _generate_default_rationale,
@@ -5,20 +7,19 @@ from app.agents.decision_maker import (
 )
 
 
-def test_fallback_decision_with_trigger():
-    """When trigger is present, fallback should recommend publishing."""
-    result = _fallback_decision(has_trigger=True)
-    assert result["recommendation"] == "publish_to_github"
-    assert result["confidence"] == "high"
-    assert "trigger" in result["rationale"].lower()
-
-
-def test_fallback_decision_without_trigger():
-    """When no trigger, fallback should recommend local storage only."""
-    result = _fallback_decision(has_trigger=False)
-    assert result["recommendation"] == "store_locally_only"
+@pytest.mark.parametrize(
+    ("has_trigger", "expected_recommendation", "rationale_fragment"),
+    [
+        (True, "publish_to_github", "trigger"),
+        (False, "store_locally_only", "no publish trigger"),
+    ],
+)
+def test_fallback_decision(has_trigger, expected_recommendation, rationale_fragment):
+    """Fallback recommends publishing only when a trigger is present."""
+    result = _fallback_decision(has_trigger=has_trigger)
+    assert result["recommendation"] == expected_recommendation
     assert result["confidence"] == "high"
-    assert "No publish trigger" in result["rationale"]
+    assert rationale_fragment in result["rationale"].lower()
 
 
 def test_validate_decision_normalizes_invalid_recommendation():
@@ -52,13 +53,14 @@ def test_validate_decision_generates_default_rationale():
     assert len(result["rationale"]) > 0
 
 
-def test_generate_default_rationale_for_publish_with_trigger():
-    """Rationale for publish with trigger should mention trigger."""
-    rationale = _generate_default_rationale("publish_to_github", has_trigger=True)
-    assert "trigger" in rationale.lower()
-
-
-def test_generate_default_rationale_for_store_locally():
-    """Rationale for local storage should be appropriate."""
-    rationale = _generate_default_rationale("store_locally_only", has_trigger=False)
-    assert "No publish trigger" in rationale or "locally" in rationale.lower()
+@pytest.mark.parametrize(
+    ("recommendation", "has_trigger", "fragment"),
+    [
+        ("publish_to_github", True, "trigger"),
+        ("store_locally_only", False, "locally"),
+    ],
+)
+def test_generate_default_rationale(recommendation, has_trigger, fragment):
+    """Default rationales should reflect the recommendation and trigger."""
+    rationale = _generate_default_rationale(recommendation, has_trigger=has_trigger)
+    assert fragment in rationale.lower()
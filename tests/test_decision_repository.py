@@ -1,8 +1,7 @@
-import tempfile
-from pathlib import Path
-
-from sqlalchemy import create_engine
+import pytest
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.database.models import Base, Decision
 from app.database.repository import (
@@ -10,132 +9,121 @@ from app.database.repository import (
     get_recent_decisions,
     save_decision,
 )
+from tests.conftest import apply_fast_sqlite_pragmas
+
+
+@pytest.fixture(scope="module")
+def _shared_repo_engine():
+    """One in-memory engine per module — DDL compiles once."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    apply_fast_sqlite_pragmas(engine)
+    Base.metadata.create_all(engine)
+    # In-memory engine — teardown is a no-op, so skip the dispose
+    return engine
+
+
+@pytest.fixture
+def repo_engine(_shared_repo_engine, monkeypatch):
+    """Swap the shared engine into the repository module; reset data with
+    DELETEs in dependency order — far cheaper than DROP+CREATE."""
+    monkeypatch.setattr("app.database.repository.engine", _shared_repo_engine)
+    yield _shared_repo_engine
+    with _shared_repo_engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            conn.execute(table.delete())
 
 
-def test_save_decision():
+def test_save_decision(repo_engine):
     """Test saving a decision to the database."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        engine = create_engine(f"sqlite:///{db_path}")
-        Base.metadata.create_all(engine)
-
-        # Mock the module-level engine
-        import app.database.repository as repo
-
-        original_engine = repo.engine
-        repo.engine = engine
-
-        try:
-            decision = save_decision(
-                decision_name="test_decision",
-                context="Test context",
-                options="Option 1\nOption 2",
-                recommendation="publish_to_github",
-                rationale="Test rationale",
-                confidence="high",
-                content_item_id=1,
-                telegram_message_id=123,
-            )
-
-            assert decision.id is not None
-            assert decision.decision_name == "test_decision"
-            assert decision.recommendation == "publish_to_github"
-            assert decision.confidence == "high"
-            assert decision.content_item_id == 1
-            assert decision.telegram_message_id == 123
-
-        finally:
-            repo.engine = original_engine
-            engine.dispose()
-
-
-def test_get_decisions_by_content_item():
+    decision = save_decision(
+        decision_name="test_decision",
+        context="Test context",
+        options="Option 1\nOption 2",
+        recommendation="publish_to_github",
+        rationale="Test rationale",
+        confidence="high",
+        content_item_id=1,
+        telegram_message_id=123,
+    )
+
+    assert decision.id is not None
+    assert decision.decision_name == "test_decision"
+    assert decision.recommendation == "publish_to_github"
+    assert decision.confidence == "high"
+    assert decision.content_item_id == 1
+    assert decision.telegram_message_id == 123
+
+
+def test_get_decisions_by_content_item(repo_engine):
     """Test retrieving decisions by content item ID."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        engine = create_engine(f"sqlite:///{db_path}")
-        Base.metadata.create_all(engine)
-
-        with Session(engine) as session:
-            # Create test decisions
-            d1 = Decision(
-                decision_name="decision1",
-                context="context1",
-                options="opt1",
-                recommendation="publish_to_github",
-                rationale="rationale1",
-                confidence="high",
-                content_item_id=1,
-            )
-            d2 = Decision(
-                decision_name="decision2",
-                context="context2",
-                options="opt2",
-                recommendation="store_locally_only",
-                rationale="rationale2",
-                confidence="medium",
-                content_item_id=1,
-            )
-            d3 = Decision(
-                decision_name="decision3",
-                context="context3",
-                options="opt3",
-                recommendation="publish_to_github",
-                rationale="rationale3",
-                confidence="high",
-                content_item_id=2,
-            )
-            session.add_all([d1, d2, d3])
-            session.commit()
-
-        import app.database.repository as repo
-
-        original_engine = repo.engine
-        repo.engine = engine
-
-        try:
-            decisions = get_decisions_by_content_item(1)
-            assert len(decisions) == 2
-            assert all(d.content_item_id == 1 for d in decisions)
-
-        finally:
-            repo.engine = original_engine
-            engine.dispose()
-
-
-def test_get_recent_decisions():
+    with Session(repo_engine) as session:
+        # Core insert: the seed rows only need to be queryable, so skip
+        # per-instance ORM state machinery
+        session.execute(
+            insert(Decision),
+            [
+                {
+                    "decision_name": "decision1",
+                    "context": "context1",
+                    "options": "opt1",
+                    "recommendation": "publish_to_github",
+                    "rationale": "rationale1",
+                    "confidence": "high",
+                    "content_item_id": 1,
+                },
+                {
+                    "decision_name": "decision2",
+                    "context": "context2",
+                    "options": "opt2",
+                    "recommendation": "store_locally_only",
+                    "rationale": "rationale2",
+                    "confidence": "medium",
+                    "content_item_id": 1,
+                },
+                {
+                    "decision_name": "decision3",
+                    "context": "context3",
+                    "options": "opt3",
+                    "recommendation": "publish_to_github",
+                    "rationale": "rationale3",
+                    "confidence": "high",
+                    "content_item_id": 2,
+                },
+            ],
+        )
+        session.commit()
+
+    decisions = get_decisions_by_content_item(1)
+    assert len(decisions) == 2
+    assert all(d.content_item_id == 1 for d in decisions)
+
+
+def test_get_recent_decisions(repo_engine):
     """Test retrieving recent decisions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = Path(tmpdir) / "test.db"
-        engine = create_engine(f"sqlite:///{db_path}")
-        Base.metadata.create_all(engine)
-
-        with Session(engine) as session:
-            # Create multiple test decisions
-            for i in range(5):
-                decision = Decision(
-                    decision_name=f"decision{i}",
-                    context=f"context{i}",
-                    options="opts",
-                    recommendation="publish_to_github",
-                    rationale="rationale",
-                    confidence="high",
-                )
-                session.add(decision)
-            session.commit()
-
-        import app.database.repository as repo
-
-        original_engine = repo.engine
-        repo.engine = engine
-
-        try:
-            decisions = get_recent_decisions(limit=3)
-            assert len(decisions) == 3
-
-        finally:
-            repo.engine = original_engine
-            engine.dispose()
+    with Session(repo_engine) as session:
+        # Seed with one multi-row INSERT
+        session.execute(
+            insert(Decision),
+            [
+                {
+                    "decision_name": f"decision{i}",
+                    "context": f"context{i}",
+                    "options": "opts",
+                    "recommendation": "publish_to_github",
+                    "rationale": "rationale",
+                    "confidence": "high",
+                }
+                for i in range(5)
+            ],
+        )
+        session.commit()
+
+    decisions = get_recent_decisions(limit=3)
+    assert len(decisions) == 3
 
 
 def test_decision_model_repr():
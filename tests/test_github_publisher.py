@@ -1,6 +1,40 @@
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
-from app.agents.github_publisher import CONTENT_TYPE_TO_GITHUB_FOLDER
+import pytest
+from github import GithubException
+
+from app.agents import github_publisher
+from app.agents.github_publisher import (
+    CONTENT_TYPE_TO_GITHUB_FOLDER,
+    ensure_repo_folders,
+    publish_files,
+    publish_text_content,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_known_folders():
+    """Keep the module-level folder cache from leaking between tests."""
+    github_publisher._known_folders.clear()
+    yield
+    github_publisher._known_folders.clear()
+
+
+@pytest.fixture
+def mock_repo():
+    return MagicMock()
+
+
+@pytest.fixture
+def patched_get_repo(monkeypatch, mock_repo):
+    """Point _get_repo at the mock without per-test patch decorators.
+
+    A shared copy.copy'd MagicMock template was considered but mock
+    copies share call state, so each test gets a fresh instance.
+    """
+    monkeypatch.setattr("app.agents.github_publisher._get_repo", lambda: mock_repo)
+    return mock_repo
 
 
 def test_content_type_mapping():
@@ -17,65 +51,84 @@ def test_content_type_mapping_completeness():
     assert set(CONTENT_TYPE_TO_GITHUB_FOLDER.keys()) == expected
 
 
-@patch("app.agents.github_publisher._get_repo")
-def test_ensure_repo_folders_creates_missing(mock_get_repo):
+def test_ensure_repo_folders_creates_missing(patched_get_repo):
     """Test that ensure_repo_folders creates .gitkeep for missing folders."""
-    from github import GithubException
-
-    from app.agents.github_publisher import ensure_repo_folders
-
-    mock_repo = MagicMock()
-
     # Simulate all folders missing (404)
-    mock_repo.get_contents.side_effect = GithubException(
+    patched_get_repo.get_contents.side_effect = GithubException(
         status=404, data={"message": "Not Found"}, headers={}
     )
-    mock_repo.create_file.return_value = None
-    mock_get_repo.return_value = mock_repo
+    patched_get_repo.create_file.return_value = None
 
     ensure_repo_folders()
 
     # Should attempt to create .gitkeep for each missing folder
     assert (
-        mock_repo.create_file.call_count == 5
+        patched_get_repo.create_file.call_count == 5
     )  # pictures, documents, audios, links, notes
 
 
-@patch("app.agents.github_publisher._get_repo")
-def test_ensure_repo_folders_skips_existing(mock_get_repo):
+def test_ensure_repo_folders_skips_existing(patched_get_repo):
     """Test that ensure_repo_folders skips existing folders."""
-    mock_repo = MagicMock()
-
     # Simulate all folders exist
-    mock_repo.get_contents.return_value = MagicMock()
-    mock_get_repo.return_value = mock_repo
-
-    from app.agents.github_publisher import ensure_repo_folders
+    patched_get_repo.get_contents.return_value = SimpleNamespace()
 
     ensure_repo_folders()
 
     # Should not create any files
-    mock_repo.create_file.assert_not_called()
+    patched_get_repo.create_file.assert_not_called()
+
+
+def test_publish_files_single_commit(patched_get_repo):
+    """Test the batched Git Data publish: blobs, one tree, one commit."""
+    patched_get_repo.default_branch = "main"
+    patched_get_repo.html_url = "https://github.com/user/repo"
+    patched_get_repo.create_git_blob.side_effect = [
+        SimpleNamespace(sha="blob-md"),
+        SimpleNamespace(sha="blob-pdf"),
+    ]
+    commit = SimpleNamespace(sha="commit-sha")
+    patched_get_repo.create_git_commit.return_value = commit
+
+    url = publish_files(
+        [("notes/general/a.md", b"# md"), ("notes/general/raw.pdf", b"%PDF")],
+        "Add note",
+    )
+
+    # One blob per file, one tree, one commit, and the branch ref advanced
+    assert patched_get_repo.create_git_blob.call_count == 2
+    patched_get_repo.create_git_tree.assert_called_once()
+    patched_get_repo.create_git_commit.assert_called_once()
+    assert patched_get_repo.create_git_commit.call_args.args[0] == "Add note"
+    patched_get_repo.get_git_ref.assert_called_once_with("heads/main")
+    patched_get_repo.get_git_ref.return_value.edit.assert_called_once_with(
+        "commit-sha"
+    )
 
+    # Returned URL points at the first file on the default branch
+    assert url == "https://github.com/user/repo/blob/main/notes/general/a.md"
 
-@patch("app.agents.github_publisher._get_repo")
-def test_publish_text_content_creates_new_file(mock_get_repo):
-    """Test publishing a new text file to GitHub."""
-    from github import GithubException
 
-    from app.agents.github_publisher import publish_text_content
+def test_publish_files_rejects_empty_list(patched_get_repo):
+    """Test that an empty file list fails fast before any API call."""
+    with pytest.raises(ValueError, match="at least one file"):
+        publish_files([], "Nothing to add")
+
+    patched_get_repo.create_git_blob.assert_not_called()
+    patched_get_repo.create_git_commit.assert_not_called()
 
-    mock_repo = MagicMock()
 
+def test_publish_text_content_creates_new_file(patched_get_repo):
+    """Test publishing a new text file to GitHub."""
     # File doesn't exist yet
-    mock_repo.get_contents.side_effect = GithubException(
+    patched_get_repo.get_contents.side_effect = GithubException(
         status=404, data={"message": "Not Found"}, headers={}
     )
 
-    mock_content = MagicMock()
-    mock_content.html_url = "https://github.com/user/repo/blob/main/notes/test.md"
-    mock_repo.create_file.return_value = {"content": mock_content}
-    mock_get_repo.return_value = mock_repo
+    # Only the html_url attribute is read — no call recording needed
+    mock_content = SimpleNamespace(
+        html_url="https://github.com/user/repo/blob/main/notes/test.md"
+    )
+    patched_get_repo.create_file.return_value = {"content": mock_content}
 
     url = publish_text_content(
         folder_path="notes/general",
@@ -85,25 +138,18 @@ def test_publish_text_content_creates_new_file(mock_get_repo):
     )
 
     assert url == "https://github.com/user/repo/blob/main/notes/test.md"
-    mock_repo.create_file.assert_called()
+    patched_get_repo.create_file.assert_called()
 
 
-@patch("app.agents.github_publisher._get_repo")
-def test_publish_text_content_updates_existing(mock_get_repo):
+def test_publish_text_content_updates_existing(patched_get_repo):
     """Test updating an existing file in GitHub."""
-    from app.agents.github_publisher import publish_text_content
-
-    mock_repo = MagicMock()
-
     # File already exists
-    mock_existing = MagicMock()
-    mock_existing.sha = "abc123"
-    mock_repo.get_contents.return_value = mock_existing
+    patched_get_repo.get_contents.return_value = SimpleNamespace(sha="abc123")
 
-    mock_content = MagicMock()
-    mock_content.html_url = "https://github.com/user/repo/blob/main/notes/test.md"
-    mock_repo.update_file.return_value = {"content": mock_content}
-    mock_get_repo.return_value = mock_repo
+    mock_content = SimpleNamespace(
+        html_url="https://github.com/user/repo/blob/main/notes/test.md"
+    )
+    patched_get_repo.update_file.return_value = {"content": mock_content}
 
     url = publish_text_content(
         folder_path="notes/general",
@@ -113,4 +159,4 @@ def test_publish_text_content_updates_existing(mock_get_repo):
     )
 
     assert url == "https://github.com/user/repo/blob/main/notes/test.md"
-    mock_repo.update_file.assert_called_once()
+    patched_get_repo.update_file.assert_called_once()